@@ -10,11 +10,15 @@ from urllib.parse import urlparse, parse_qs, unquote
 import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.components import webhook
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, format_mac
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
 
+from .helpers import DeviceConfigUpdater
 from .const import (
     DOMAIN,
     ENTRY_TYPE_HUB,
@@ -42,10 +46,23 @@ from .const import (
     WEBHOOK_REGISTER,
     WEBHOOK_STATUS,
     WEBHOOK_KEY_EVENT,
+    SIGNAL_DEVICE_UPDATE,
+    EVENT_DEVICE_DISCOVERED,
+    EVENT_DEVICE_UPDATE,
+    EVENT_KEY_EVENT,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Timeouts for requests to tablets on the local network
+PUSH_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=5)
+COMMAND_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# Quiet period before config changes from entities are pushed to a tablet
+PUSH_DEBOUNCE = 0.3
+# Longest a push may be held back by a continuous stream of changes
+PUSH_MAX_DELAY = 2.0
+
 def parse_immich_url(url_or_filter: Any) -> dict:
     """Parse Immich URL into search filter format.
     
@@ -146,11 +163,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_setup_hub_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up PhotoDream Hub (tablets)."""
+    # Guarantee the devices dict so config writers need no fallbacks
+    if CONF_DEVICES not in entry.data:
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_DEVICES: {}}
+        )
+    
     hass.data[DOMAIN]["hub"] = {
         "entry": entry,
         "entry_id": entry.entry_id,  # Store ID for fresh lookups
         "devices": {},  # Runtime device status
         "pending_devices": {},  # Devices waiting for approval
+        "device_info": {},  # Shared DeviceInfo per device: ((name, MAC), info)
+        "config_updater": DeviceConfigUpdater(hass, entry.entry_id),
+        "push_timers": {},  # Debounced config pushes: (cancel, first change)
+        "sensor_listeners": {},  # Added tablet sensors per device
     }
     
     # Register webhook for device registration (discovery)
@@ -203,8 +230,13 @@ async def async_setup_immich_entry(hass: HomeAssistant, entry: ConfigEntry) -> b
     hass.data[DOMAIN]["immich"][entry.entry_id] = {
         "entry": entry,
         "coordinator": coordinator,
+        "url": entry.data.get(CONF_IMMICH_URL, "").rstrip("/"),  # Normalized once
     }
     
+    # Profile selects cache the profile list; rebuild it on any change
+    _invalidate_profiles_cache(hass)
+    entry.async_on_unload(entry.add_update_listener(_async_immich_entry_updated))
+    
     # Create profile devices in registry
     await create_profile_devices(hass, entry)
     
@@ -214,6 +246,21 @@ async def async_setup_immich_entry(hass: HomeAssistant, entry: ConfigEntry) -> b
     return True
 
 
+@callback
+def _invalidate_profiles_cache(hass: HomeAssistant) -> None:
+    """Drop the cached profile list and profile -> photo URL prefixes."""
+    hass.data[DOMAIN].pop("profiles_cache", None)
+    hass.data[DOMAIN].pop("photo_url_prefixes", None)
+
+
+async def _async_immich_entry_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Handle Immich entry updates."""
+    hass.data[DOMAIN]["immich"][entry.entry_id]["url"] = (
+        entry.data.get(CONF_IMMICH_URL, "").rstrip("/")
+    )
+    _invalidate_profiles_cache(hass)
+
+
 async def create_profile_devices(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Create device registry entries for each profile."""
     device_registry = dr.async_get(hass)
@@ -248,6 +295,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_hub_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload Hub entry."""
+    # Write any queued device config changes and drop scheduled pushes
+    hub_data = hass.data[DOMAIN]["hub"]
+    hub_data["config_updater"].async_shutdown()
+    for cancel, _ in hub_data["push_timers"].values():
+        cancel()
+    hub_data["push_timers"].clear()
+    
     # Unregister webhooks
     webhook.async_unregister(hass, WEBHOOK_REGISTER)
     webhook.async_unregister(hass, f"{WEBHOOK_STATUS}_{entry.entry_id}")
@@ -279,6 +333,7 @@ async def async_unload_immich_entry(hass: HomeAssistant, entry: ConfigEntry) ->
             _LOGGER.debug("Removed profile device: %s", profile_name)
     
     hass.data[DOMAIN]["immich"].pop(entry.entry_id, None)
+    _invalidate_profiles_cache(hass)
     
     # Remove coordinator from cache so it gets recreated on reload
     coordinators = hass.data[DOMAIN].get("coordinators", {})
@@ -348,7 +403,7 @@ async def handle_register_webhook(
         
         # Fire discovery event for config flow
         hass.bus.async_fire(
-            f"{DOMAIN}_device_discovered",
+            EVENT_DEVICE_DISCOVERED,
             {"device_id": device_id, "device_ip": device_ip, "device_port": device_port},
         )
         
@@ -406,9 +461,12 @@ async def handle_status_webhook(
             if mac_address:
                 await _update_device_mac(hass, hub_data["entry"].entry_id, device_id, mac_address)
             
-            # Fire event for entity updates
+            # Notify only this device's entities
+            async_dispatcher_send(hass, SIGNAL_DEVICE_UPDATE.format(device_id), data)
+            
+            # Fire event for automations
             hass.bus.async_fire(
-                f"{DOMAIN}_device_update",
+                EVENT_DEVICE_UPDATE,
                 {"device_id": device_id, "data": data},
             )
         
@@ -436,7 +494,7 @@ async def handle_key_event_webhook(
         
         # Fire Home Assistant event that automations can trigger on
         hass.bus.async_fire(
-            f"{DOMAIN}_key_event",
+            EVENT_KEY_EVENT,
             {
                 "device_id": device_id,
                 "key_code": key_code,
@@ -535,7 +593,8 @@ async def get_device_config(hass: HomeAssistant, device_id: str) -> dict | None:
     if device_id not in devices:
         return None
     
-    device = devices[device_id]
+    # Include changes that are still queued for the next entry update
+    device = hub_data["config_updater"].get_device_config(entry, device_id)
     profile_id = device.get(CONF_PROFILE_ID, device.get("profile", ""))
     
     _LOGGER.info("get_device_config: device=%s, profile_id='%s'", device_id, profile_id)
@@ -639,14 +698,14 @@ async def push_config_to_device(hass: HomeAssistant, device_id: str) -> bool:
     url = f"http://{ip}:{port}/configure"
     _LOGGER.info("Pushing config to device %s at %s (profile: %s)", device_id, url, config.get("profile", {}).get("name"))
     
+    session = async_get_clientsession(hass)
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=config, timeout=10) as resp:
-                if resp.status == 200:
-                    _LOGGER.info("Config pushed to device %s", device_id)
-                    return True
-                else:
-                    _LOGGER.error("Failed to push config to %s: HTTP %s", device_id, resp.status)
+        async with session.post(url, json=config, timeout=PUSH_TIMEOUT) as resp:
+            if resp.status == 200:
+                _LOGGER.info("Config pushed to device %s", device_id)
+                return True
+            else:
+                _LOGGER.error("Failed to push config to %s: HTTP %s", device_id, resp.status)
     except aiohttp.ClientConnectorError as e:
         _LOGGER.error("Cannot connect to device %s at %s: %s", device_id, url, e)
     except Exception as e:
@@ -655,6 +714,37 @@ async def push_config_to_device(hass: HomeAssistant, device_id: str) -> bool:
     return False
 
 
+@callback
+def schedule_push_config(
+    hass: HomeAssistant, device_id: str, delay: float = PUSH_DEBOUNCE
+) -> None:
+    """Push configuration to a device once changes have settled.
+    
+    Each call restarts the device's timer, so a burst of changes results in
+    a single push. The push is never held back more than PUSH_MAX_DELAY
+    after the first change of a burst.
+    """
+    hub_data = hass.data[DOMAIN]["hub"]
+    timers = hub_data["push_timers"]
+    now = hass.loop.time()
+    first_change = now
+    if (pending := timers.pop(device_id, None)) is not None:
+        cancel, first_change = pending
+        cancel()
+    delay = min(delay, max(0.0, first_change + PUSH_MAX_DELAY - now))
+    
+    @callback
+    def _async_push(_now) -> None:
+        timers.pop(device_id, None)
+        hub_data["entry"].async_create_background_task(
+            hass,
+            push_config_to_device(hass, device_id),
+            f"{DOMAIN}_push_config_{device_id}",
+        )
+    
+    timers[device_id] = (async_call_later(hass, delay, _async_push), first_change)
+
+
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up PhotoDream services."""
     
@@ -681,12 +771,9 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         if not entry:
             return
         
-        devices = dict(entry.data.get(CONF_DEVICES, {}))
-        if device_id in devices:
-            devices[device_id] = {**devices[device_id], CONF_PROFILE_ID: profile_id}
-            new_data = dict(entry.data)
-            new_data[CONF_DEVICES] = devices
-            hass.config_entries.async_update_entry(entry, data=new_data)
+        if device_id in entry.data.get(CONF_DEVICES, {}):
+            # Batched with any entity changes; the push already sees it
+            hub_data["config_updater"].queue(entry, device_id, CONF_PROFILE_ID, profile_id)
             await push_config_to_device(hass, device_id)
     
     hass.services.async_register(DOMAIN, SERVICE_NEXT_IMAGE, handle_next_image)
@@ -718,14 +805,14 @@ async def get_device_data(
     
     url = f"http://{ip}:{port}/{endpoint}"
     
+    session = async_get_clientsession(hass)
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=5) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                else:
-                    _LOGGER.warning("Device %s returned %d for %s", device_id, resp.status, endpoint)
-                    return None
+        async with session.get(url, timeout=COMMAND_TIMEOUT) as resp:
+            if resp.status == 200:
+                return await resp.json()
+            else:
+                _LOGGER.warning("Device %s returned %d for %s", device_id, resp.status, endpoint)
+                return None
     except Exception as e:
         _LOGGER.error("Failed to get data from device %s: %s", device_id, e)
         return None
@@ -755,14 +842,14 @@ async def send_command_to_device(
     
     url = f"http://{ip}:{port}/{command}"
     
+    session = async_get_clientsession(hass)
     try:
-        async with aiohttp.ClientSession() as session:
-            if data:
-                async with session.post(url, json=data, timeout=5) as resp:
-                    return resp.status == 200
-            else:
-                async with session.post(url, timeout=5) as resp:
-                    return resp.status == 200
+        if data:
+            async with session.post(url, json=data, timeout=COMMAND_TIMEOUT) as resp:
+                return resp.status == 200
+        else:
+            async with session.post(url, timeout=COMMAND_TIMEOUT) as resp:
+                return resp.status == 200
     except Exception as e:
         _LOGGER.error("Failed to send command to device %s: %s", device_id, e)
         return False
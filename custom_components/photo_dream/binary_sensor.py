@@ -10,6 +10,8 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .helpers import get_device_info
 
@@ -18,6 +20,7 @@ from .const import (
     ENTRY_TYPE_HUB,
     CONF_DEVICES,
     ATTR_LAST_SEEN,
+    SIGNAL_DEVICE_UPDATE,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -36,12 +39,21 @@ async def async_setup_entry(
     if entry.data.get("entry_type") != ENTRY_TYPE_HUB:
         return
     
-    devices = entry.data.get(CONF_DEVICES, {})
+    devices = entry.data[CONF_DEVICES]
+    if not devices:
+        return
     
     entities = []
     for device_id, device_config in devices.items():
-        entities.append(PhotoDreamOnlineSensor(hass, entry, device_id, device_config))
-        entities.append(PhotoDreamActiveSensor(hass, entry, device_id, device_config))
+        # Shared by all binary sensors of this device
+        unique_id_prefix = f"{entry.entry_id}_{device_id}"
+        device_info = get_device_info(hass, entry, device_id, device_config)
+        entities.extend(
+            entity_class(
+                hass, entry, device_id, device_config, unique_id_prefix, device_info
+            )
+            for entity_class in (PhotoDreamOnlineSensor, PhotoDreamActiveSensor)
+        )
     
     async_add_entities(entities)
 
@@ -57,13 +69,14 @@ class PhotoDreamBaseBinarySensor(BinarySensorEntity):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         self.hass = hass
         self._entry = entry
         self._device_id = device_id
         self._device_config = device_config
-        self._attr_device_info = get_device_info(hass, entry, device_id, device_config)
+        self._attr_device_info = device_info
 
     def _get_device_data(self) -> dict | None:
         """Get device data from hass.data."""
@@ -75,17 +88,17 @@ class PhotoDreamBaseBinarySensor(BinarySensorEntity):
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         self.async_on_remove(
-            self.hass.bus.async_listen(
-                f"{DOMAIN}_device_update",
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_DEVICE_UPDATE.format(self._device_id),
                 self._handle_device_update,
             )
         )
 
     @callback
-    def _handle_device_update(self, event) -> None:
+    def _handle_device_update(self, data: dict) -> None:
         """Handle device update event."""
-        if event.data.get("device_id") == self._device_id:
-            self.async_write_ha_state()
+        self.async_write_ha_state()
 
 
 class PhotoDreamOnlineSensor(PhotoDreamBaseBinarySensor):
@@ -100,10 +113,12 @@ class PhotoDreamOnlineSensor(PhotoDreamBaseBinarySensor):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_online"
+        super().__init__(hass, entry, device_id, device_config, device_info)
+        self._attr_unique_id = f"{unique_id_prefix}_online"
 
     @property
     def is_on(self) -> bool:
@@ -137,10 +152,12 @@ class PhotoDreamActiveSensor(PhotoDreamBaseBinarySensor):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_active"
+        super().__init__(hass, entry, device_id, device_config, device_info)
+        self._attr_unique_id = f"{unique_id_prefix}_active"
 
     @property
     def is_on(self) -> bool:
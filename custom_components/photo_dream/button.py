@@ -6,6 +6,7 @@ import logging
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import (
@@ -42,13 +43,25 @@ async def async_setup_hub_buttons(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up tablet buttons for Hub entry."""
-    devices = entry.data.get(CONF_DEVICES, {})
+    devices = entry.data[CONF_DEVICES]
+    if not devices:
+        return
     
     entities = []
     for device_id, device_config in devices.items():
-        entities.append(PhotoDreamNextImageButton(hass, entry, device_id, device_config))
-        entities.append(PhotoDreamSlideshowStartButton(hass, entry, device_id, device_config))
-        entities.append(PhotoDreamSlideshowExitButton(hass, entry, device_id, device_config))
+        # Shared by all buttons of this device
+        unique_id_prefix = f"{entry.entry_id}_{device_id}"
+        device_info = get_device_info(hass, entry, device_id, device_config)
+        entities.extend(
+            entity_class(
+                hass, entry, device_id, device_config, unique_id_prefix, device_info
+            )
+            for entity_class in (
+                PhotoDreamNextImageButton,
+                PhotoDreamSlideshowStartButton,
+                PhotoDreamSlideshowExitButton,
+            )
+        )
     
     async_add_entities(entities)
 
@@ -90,13 +103,14 @@ class PhotoDreamBaseButton(ButtonEntity):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the button."""
         self.hass = hass
         self._entry = entry
         self._device_id = device_id
         self._device_config = device_config
-        self._attr_device_info = get_device_info(hass, entry, device_id, device_config)
+        self._attr_device_info = device_info
 
 
 class PhotoDreamNextImageButton(PhotoDreamBaseButton):
@@ -111,10 +125,12 @@ class PhotoDreamNextImageButton(PhotoDreamBaseButton):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the button."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_next_image"
+        super().__init__(hass, entry, device_id, device_config, device_info)
+        self._attr_unique_id = f"{unique_id_prefix}_next_image"
 
     async def async_press(self) -> None:
         """Handle the button press."""
@@ -134,10 +150,12 @@ class PhotoDreamSlideshowStartButton(PhotoDreamBaseButton):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the button."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_slideshow_start"
+        super().__init__(hass, entry, device_id, device_config, device_info)
+        self._attr_unique_id = f"{unique_id_prefix}_slideshow_start"
 
     async def async_press(self) -> None:
         """Handle the button press."""
@@ -157,10 +175,12 @@ class PhotoDreamSlideshowExitButton(PhotoDreamBaseButton):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the button."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_slideshow_exit"
+        super().__init__(hass, entry, device_id, device_config, device_info)
+        self._attr_unique_id = f"{unique_id_prefix}_slideshow_exit"
 
     async def async_press(self) -> None:
         """Handle the button press."""
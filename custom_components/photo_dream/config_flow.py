@@ -1,18 +1,22 @@
 """Config flow for PhotoDream integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import json
+import re
+from functools import lru_cache
+from collections.abc import Iterable
 from typing import Any
-from urllib.parse import urlparse, parse_qs, unquote
+from urllib.parse import urlparse, unquote, unquote_plus
 
-import aiohttp
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult, OptionsFlow, ConfigEntry
 from homeassistant.core import callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     DOMAIN,
@@ -30,6 +34,7 @@ from .const import (
     CONF_PROFILE_NAME,
     CONF_PROFILE_ID,
     CONF_SEARCH_FILTER,
+    CONF_SEARCH_FILTER_RAW,
     CONF_EXCLUDE_PATHS,
     CONF_MEDIA_TYPE,
     CONF_CLOCK,
@@ -57,6 +62,9 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_EXCLUDE_SPLIT = re.compile(r"\s*,\s*")
+_JSON_DECODER = json.JSONDecoder()
+
 
 def parse_immich_search_input(input_str: str) -> dict:
     """Parse Immich search URL or JSON into a search filter dict.
@@ -69,7 +77,18 @@ def parse_immich_search_input(input_str: str) -> dict:
     - Plain JSON string
     - Plain text -> {"query": "text"} (semantic search)
     """
-    import re
+    # Decode the cached JSON string so callers always get their own copy
+    return json.loads(_parse_immich_search_input_cached(input_str))
+
+
+@lru_cache(maxsize=128)
+def _parse_immich_search_input_cached(input_str: str) -> str:
+    """Parse search input and return the filter as a JSON string."""
+    return json.dumps(_parse_immich_search_input(input_str))
+
+
+def _parse_immich_search_input(input_str: str) -> dict:
+    """Parse Immich search input (uncached)."""
     input_str = input_str.strip()
     if not input_str:
         return {}
@@ -95,44 +114,164 @@ def parse_immich_search_input(input_str: str) -> dict:
                 return {"albumId": album_id}
             
             # /search?query={json}
-            if parsed.query:
-                query_params = parse_qs(parsed.query)
-                if "query" in query_params:
-                    json_str = unquote(query_params["query"][0])
+            # Only the "query" parameter is needed, so scan for it directly
+            # instead of decoding every parameter with parse_qs.
+            for part in parsed.query.split("&"):
+                if part.startswith("query="):
+                    json_str = unquote(unquote_plus(part[6:]))
                     try:
-                        result = json.loads(json_str)
+                        result = _JSON_DECODER.decode(json_str)
                         _LOGGER.debug("Parsed search URL: %s", result)
                         return result
                     except json.JSONDecodeError:
                         pass
+                    break
             
             _LOGGER.warning("Unknown Immich URL format: %s", input_str)
             return {"query": input_str}
             
-        except Exception as e:
+        except ValueError as e:
             _LOGGER.debug("Failed to parse as URL: %s", e)
     
     # URL-encoded JSON
     if "%7B" in input_str or "%22" in input_str:
-        try:
-            decoded = unquote(input_str)
-            return json.loads(decoded)
-        except Exception as e:
-            _LOGGER.debug("Failed to parse as URL-encoded JSON: %s", e)
+        decoded = unquote(input_str)
+        if decoded.lstrip()[:1] in ("{", "["):
+            try:
+                return _JSON_DECODER.decode(decoded)
+            except ValueError as e:
+                _LOGGER.debug("Failed to parse as URL-encoded JSON: %s", e)
     
-    try:
-        return json.loads(input_str)
-    except Exception as e:
-        _LOGGER.debug("Failed to parse as JSON: %s", e)
+    # Plain text can't be JSON, skip the parser
+    if input_str[:1] in ("{", "["):
+        try:
+            return _JSON_DECODER.decode(input_str)
+        except ValueError as e:
+            _LOGGER.debug("Failed to parse as JSON: %s", e)
     
     return {"query": input_str}
 
 
+def _parse_exclude_paths(value: str) -> list[str]:
+    """Split a comma separated exclude paths string into a list."""
+    return [p for p in _EXCLUDE_SPLIT.split(value.strip()) if p]
+
+
+def _build_profile(user_input: dict[str, Any]) -> dict[str, Any]:
+    """Build a profile config from profile form input."""
+    search_input = user_input.get(CONF_SEARCH_FILTER, "")
+    # Keep the serialized filter so edit forms don't re-encode it
+    filter_raw = _parse_immich_search_input_cached(search_input) if search_input else "{}"
+    search_filter = json.loads(filter_raw)
+    return {
+        CONF_SEARCH_FILTER: search_filter,
+        CONF_SEARCH_FILTER_RAW: filter_raw if search_filter else "",
+        CONF_EXCLUDE_PATHS: _parse_exclude_paths(user_input.get(CONF_EXCLUDE_PATHS, "")),
+        CONF_MEDIA_TYPE: user_input.get(CONF_MEDIA_TYPE, DEFAULT_MEDIA_TYPE),
+    }
+
+
+@lru_cache(maxsize=512)
 def generate_profile_id(immich_entry_id: str, profile_name: str) -> str:
     """Generate a unique profile ID."""
     return f"{immich_entry_id}_{profile_name}".replace(" ", "_").lower()
 
 
+def _collect_profiles(entries: Iterable[ConfigEntry]) -> dict[str, str]:
+    """Get all profiles from all Immich instances as {profile_id: display_name}."""
+    profiles = {}
+    for entry in entries:
+        if entry.data.get("entry_type") == ENTRY_TYPE_IMMICH:
+            immich_name = entry.data.get(CONF_IMMICH_NAME, "Immich")
+            for profile_name in entry.data.get(CONF_PROFILES, {}).keys():
+                profile_id = generate_profile_id(entry.entry_id, profile_name)
+                profiles[profile_id] = f"{immich_name} / {profile_name}"
+    return profiles
+
+
+# Display settings stored per device, with their defaults
+_DEVICE_FIELDS: tuple[tuple[str, Any], ...] = (
+    (CONF_CLOCK, DEFAULT_CLOCK),
+    (CONF_CLOCK_POSITION, DEFAULT_CLOCK_POSITION),
+    (CONF_CLOCK_FORMAT, DEFAULT_CLOCK_FORMAT),
+    (CONF_CLOCK_FONT_SIZE, DEFAULT_CLOCK_FONT_SIZE),
+    (CONF_DATE, DEFAULT_DATE),
+    (CONF_DATE_FORMAT, DEFAULT_DATE_FORMAT),
+    (CONF_INTERVAL, DEFAULT_INTERVAL),
+    (CONF_PAN_SPEED, DEFAULT_PAN_SPEED),
+)
+
+
+# Shared field validators
+_CLOCK_POSITION_VAL = vol.In(CLOCK_POSITIONS)
+_CLOCK_FORMAT_VAL = vol.In(("12h", "24h"))
+_DATE_FORMAT_VAL = vol.In(DATE_FORMATS)
+_MEDIA_TYPE_VAL = vol.In(MEDIA_TYPES)
+_FLOAT_COERCE = vol.Coerce(float)
+
+# Form schemas that don't depend on runtime data are built once
+_EMPTY_SCHEMA = vol.Schema({})
+
+_IMMICH_SCHEMA = vol.Schema({
+    vol.Required(CONF_IMMICH_NAME, default="Home Server"): str,
+    vol.Required(CONF_IMMICH_URL, default="https://immich.example.com"): str,
+    vol.Required(CONF_IMMICH_API_KEY): str,
+})
+
+_PROFILE_SCHEMA = vol.Schema({
+    vol.Required(CONF_PROFILE_NAME, default="default"): str,
+    vol.Optional(CONF_SEARCH_FILTER, default=""): str,
+    vol.Optional(CONF_EXCLUDE_PATHS, default="/Private/*"): str,
+    vol.Optional(CONF_MEDIA_TYPE, default=DEFAULT_MEDIA_TYPE): _MEDIA_TYPE_VAL,
+    vol.Optional("add_another", default=False): bool,
+})
+
+_ADD_PROFILE_SCHEMA = vol.Schema({
+    vol.Required(CONF_PROFILE_NAME): str,
+    vol.Optional(CONF_SEARCH_FILTER, default=""): str,
+    vol.Optional(CONF_EXCLUDE_PATHS, default=""): str,
+    vol.Optional(CONF_MEDIA_TYPE, default=DEFAULT_MEDIA_TYPE): _MEDIA_TYPE_VAL,
+})
+
+_DEVICE_ACTION_SCHEMA = vol.Schema({
+    vol.Required("action"): vol.In({
+        "edit": "Edit device",
+        "delete": "Delete device",
+    }),
+})
+
+_PROFILE_ACTION_SCHEMA = vol.Schema({
+    vol.Required("action"): vol.In({
+        "add": "Add new profile",
+        "edit": "Edit profile",
+        "delete": "Delete profile",
+    }),
+})
+
+# Display settings for a newly discovered device (name and profile are added per form)
+_DISCOVERY_DISPLAY_SCHEMA = vol.Schema({
+    vol.Optional(CONF_CLOCK, default=DEFAULT_CLOCK): bool,
+    vol.Optional(CONF_CLOCK_POSITION, default=DEFAULT_CLOCK_POSITION): _CLOCK_POSITION_VAL,
+    vol.Optional(CONF_CLOCK_FORMAT, default=DEFAULT_CLOCK_FORMAT): _CLOCK_FORMAT_VAL,
+    vol.Optional(CONF_CLOCK_FONT_SIZE, default=DEFAULT_CLOCK_FONT_SIZE): int,
+    vol.Optional(CONF_DATE, default=DEFAULT_DATE): bool,
+    vol.Optional(CONF_DATE_FORMAT, default=DEFAULT_DATE_FORMAT): _DATE_FORMAT_VAL,
+    vol.Optional(CONF_INTERVAL, default=DEFAULT_INTERVAL): int,
+    vol.Optional(CONF_PAN_SPEED, default=DEFAULT_PAN_SPEED): _FLOAT_COERCE,
+})
+
+
+@lru_cache(maxsize=16)
+def _discovery_schema(
+    device_id: str, profile_options: tuple[tuple[str, str], ...]
+) -> vol.Schema:
+    """Build the discovery form schema, reused while the profiles don't change."""
+    return vol.Schema({
+        vol.Optional(CONF_DEVICE_NAME, default=device_id): str,
+        vol.Required(CONF_PROFILE_ID): vol.In(dict(profile_options)),
+    }).extend(_DISCOVERY_DISPLAY_SCHEMA.schema)
+
+
 class PhotoDreamConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for PhotoDream."""
 
@@ -142,19 +281,14 @@ class PhotoDreamConfigFlow(ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._data: dict[str, Any] = {}
         self._discovered_device: dict[str, Any] | None = None
+        self._profiles_cache: tuple[tuple[Any, ...], dict[str, str]] | None = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle the initial step."""
-        # Check if hub exists
-        hub_exists = any(
-            entry.data.get("entry_type") == ENTRY_TYPE_HUB
-            for entry in self._async_current_entries()
-        )
-        
         # If no hub exists, create it first then continue to Immich
-        if not hub_exists:
+        if self._async_get_hub_entry() is None:
             return await self.async_step_create_hub()
         
         # Hub exists, go directly to Immich setup
@@ -179,7 +313,7 @@ class PhotoDreamConfigFlow(ConfigFlow, domain=DOMAIN):
         # Show confirmation that hub will be created
         return self.async_show_form(
             step_id="create_hub",
-            data_schema=vol.Schema({}),
+            data_schema=_EMPTY_SCHEMA,
             description_placeholders={},
         )
 
@@ -190,8 +324,9 @@ class PhotoDreamConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
+            immich_url = user_input[CONF_IMMICH_URL].rstrip("/")
             valid = await self._test_immich_connection(
-                user_input[CONF_IMMICH_URL],
+                immich_url,
                 user_input[CONF_IMMICH_API_KEY],
             )
             
@@ -199,7 +334,7 @@ class PhotoDreamConfigFlow(ConfigFlow, domain=DOMAIN):
                 self._data = {
                     "entry_type": ENTRY_TYPE_IMMICH,
                     CONF_IMMICH_NAME: user_input[CONF_IMMICH_NAME],
-                    CONF_IMMICH_URL: user_input[CONF_IMMICH_URL].rstrip("/"),
+                    CONF_IMMICH_URL: immich_url,
                     CONF_IMMICH_API_KEY: user_input[CONF_IMMICH_API_KEY],
                     CONF_PROFILES: {},
                 }
@@ -209,11 +344,7 @@ class PhotoDreamConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="immich",
-            data_schema=vol.Schema({
-                vol.Required(CONF_IMMICH_NAME, default="Home Server"): str,
-                vol.Required(CONF_IMMICH_URL, default="https://immich.example.com"): str,
-                vol.Required(CONF_IMMICH_API_KEY): str,
-            }),
+            data_schema=_IMMICH_SCHEMA,
             errors=errors,
         )
 
@@ -223,17 +354,7 @@ class PhotoDreamConfigFlow(ConfigFlow, domain=DOMAIN):
         """Handle adding initial profile to Immich server."""
         if user_input is not None:
             profile_name = user_input[CONF_PROFILE_NAME]
-            search_input = user_input.get(CONF_SEARCH_FILTER, "")
-            search_filter = parse_immich_search_input(search_input) if search_input else {}
-            exclude_paths = [
-                p.strip() for p in user_input.get(CONF_EXCLUDE_PATHS, "").split(",") if p.strip()
-            ]
-
-            self._data[CONF_PROFILES][profile_name] = {
-                CONF_SEARCH_FILTER: search_filter,
-                CONF_EXCLUDE_PATHS: exclude_paths,
-                CONF_MEDIA_TYPE: user_input.get(CONF_MEDIA_TYPE, DEFAULT_MEDIA_TYPE),
-            }
+            self._data[CONF_PROFILES][profile_name] = _build_profile(user_input)
 
             if user_input.get("add_another"):
                 return await self.async_step_profile()
@@ -247,13 +368,7 @@ class PhotoDreamConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="profile",
-            data_schema=vol.Schema({
-                vol.Required(CONF_PROFILE_NAME, default="default"): str,
-                vol.Optional(CONF_SEARCH_FILTER, default=""): str,
-                vol.Optional(CONF_EXCLUDE_PATHS, default="/Private/*"): str,
-                vol.Optional(CONF_MEDIA_TYPE, default=DEFAULT_MEDIA_TYPE): vol.In(MEDIA_TYPES),
-                vol.Optional("add_another", default=False): bool,
-            }),
+            data_schema=_PROFILE_SCHEMA,
             description_placeholders={
                 "profile_count": str(len(self._data.get(CONF_PROFILES, {}))),
                 "immich_name": self._data.get(CONF_IMMICH_NAME, "Immich"),
@@ -311,42 +426,27 @@ class PhotoDreamConfigFlow(ConfigFlow, domain=DOMAIN):
         device_ip = self._discovered_device["device_ip"]
         device_port = self._discovered_device["device_port"]
         
-        # Find the hub entry
-        hub_entry = None
-        for entry in self._async_current_entries():
-            if entry.data.get("entry_type") == ENTRY_TYPE_HUB:
-                hub_entry = entry
-                break
-        
+        hub_entry = self._async_get_hub_entry()
         if not hub_entry:
             return self.async_abort(reason="no_hub")
         
         # Collect all profiles from all Immich instances
-        all_profiles = await self._get_all_profiles()
+        all_profiles = self._async_get_all_profiles()
         
         if not all_profiles:
             return self.async_abort(reason="no_profiles")
         
         if user_input is not None:
-            # Add device to hub
-            new_data = dict(hub_entry.data)
-            if CONF_DEVICES not in new_data:
-                new_data[CONF_DEVICES] = {}
-            
-            new_data[CONF_DEVICES][device_id] = {
+            # Add device to hub (new dicts, so the change is detected and saved)
+            device = {
                 CONF_DEVICE_NAME: user_input.get(CONF_DEVICE_NAME, device_id),
                 CONF_DEVICE_IP: device_ip,
                 CONF_DEVICE_PORT: device_port,
-                CONF_PROFILE_ID: user_input.get(CONF_PROFILE_ID, list(all_profiles.keys())[0]),
-                CONF_CLOCK: user_input.get(CONF_CLOCK, DEFAULT_CLOCK),
-                CONF_CLOCK_POSITION: user_input.get(CONF_CLOCK_POSITION, DEFAULT_CLOCK_POSITION),
-                CONF_CLOCK_FORMAT: user_input.get(CONF_CLOCK_FORMAT, DEFAULT_CLOCK_FORMAT),
-                CONF_CLOCK_FONT_SIZE: user_input.get(CONF_CLOCK_FONT_SIZE, DEFAULT_CLOCK_FONT_SIZE),
-                CONF_DATE: user_input.get(CONF_DATE, DEFAULT_DATE),
-                CONF_DATE_FORMAT: user_input.get(CONF_DATE_FORMAT, DEFAULT_DATE_FORMAT),
-                CONF_INTERVAL: user_input.get(CONF_INTERVAL, DEFAULT_INTERVAL),
-                CONF_PAN_SPEED: user_input.get(CONF_PAN_SPEED, DEFAULT_PAN_SPEED),
+                CONF_PROFILE_ID: user_input.get(CONF_PROFILE_ID, next(iter(all_profiles))),
+                **{key: user_input.get(key, default) for key, default in _DEVICE_FIELDS},
             }
+            devices = hub_entry.data.get(CONF_DEVICES, {})
+            new_data = {**hub_entry.data, CONF_DEVICES: {**devices, device_id: device}}
             
             # Update hub entry
             self.hass.config_entries.async_update_entry(hub_entry, data=new_data)
@@ -356,9 +456,9 @@ class PhotoDreamConfigFlow(ConfigFlow, domain=DOMAIN):
             await push_config_to_device(self.hass, device_id)
             
             # Remove from pending
-            for entry_data in self.hass.data.get(DOMAIN, {}).values():
-                if isinstance(entry_data, dict) and "pending_devices" in entry_data:
-                    entry_data["pending_devices"].pop(device_id, None)
+            hub_data = self.hass.data.get(DOMAIN, {}).get("hub")
+            if hub_data:
+                hub_data["pending_devices"].pop(device_id, None)
             
             # Reload hub to create entities
             await self.hass.config_entries.async_reload(hub_entry.entry_id)
@@ -367,48 +467,60 @@ class PhotoDreamConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="discovery_confirm",
-            data_schema=vol.Schema({
-                vol.Optional(CONF_DEVICE_NAME, default=device_id): str,
-                vol.Required(CONF_PROFILE_ID): vol.In(all_profiles),
-                vol.Optional(CONF_CLOCK, default=DEFAULT_CLOCK): bool,
-                vol.Optional(CONF_CLOCK_POSITION, default=DEFAULT_CLOCK_POSITION): vol.In(CLOCK_POSITIONS),
-                vol.Optional(CONF_CLOCK_FORMAT, default=DEFAULT_CLOCK_FORMAT): vol.In(["12h", "24h"]),
-                vol.Optional(CONF_CLOCK_FONT_SIZE, default=DEFAULT_CLOCK_FONT_SIZE): int,
-                vol.Optional(CONF_DATE, default=DEFAULT_DATE): bool,
-                vol.Optional(CONF_DATE_FORMAT, default=DEFAULT_DATE_FORMAT): vol.In(DATE_FORMATS),
-                vol.Optional(CONF_INTERVAL, default=DEFAULT_INTERVAL): int,
-                vol.Optional(CONF_PAN_SPEED, default=DEFAULT_PAN_SPEED): vol.Coerce(float),
-            }),
+            data_schema=_discovery_schema(device_id, tuple(all_profiles.items())),
             description_placeholders={
                 "device_id": device_id,
                 "device_ip": device_ip,
             },
         )
 
-    async def _get_all_profiles(self) -> dict[str, str]:
-        """Get all profiles from all Immich instances as {profile_id: display_name}."""
-        profiles = {}
+    @callback
+    def _async_get_hub_entry(self) -> ConfigEntry | None:
+        """Find the hub entry."""
+        # A loaded hub registers its entry id in hass.data
+        hub_data = self.hass.data.get(DOMAIN, {}).get("hub")
+        if hub_data:
+            return self.hass.config_entries.async_get_entry(hub_data["entry_id"])
+        
         for entry in self._async_current_entries():
-            if entry.data.get("entry_type") == ENTRY_TYPE_IMMICH:
-                immich_name = entry.data.get(CONF_IMMICH_NAME, "Immich")
-                for profile_name in entry.data.get(CONF_PROFILES, {}).keys():
-                    profile_id = generate_profile_id(entry.entry_id, profile_name)
-                    profiles[profile_id] = f"{immich_name} / {profile_name}"
+            if entry.data.get("entry_type") == ENTRY_TYPE_HUB:
+                return entry
+        return None
+
+    @callback
+    def _async_get_all_profiles(self) -> dict[str, str]:
+        """Get all profiles from all Immich instances as {profile_id: display_name}."""
+        entries = [
+            entry for entry in self._async_current_entries()
+            if entry.data.get("entry_type") == ENTRY_TYPE_IMMICH
+        ]
+        # Entry data is replaced on every update, so identical data objects
+        # mean the profiles haven't changed since the last form render
+        snapshot = tuple(entry.data for entry in entries)
+        if self._profiles_cache is not None:
+            cached_snapshot, cached_profiles = self._profiles_cache
+            if len(cached_snapshot) == len(snapshot) and all(
+                old is new for old, new in zip(cached_snapshot, snapshot)
+            ):
+                return cached_profiles
+        
+        profiles = _collect_profiles(entries)
+        self._profiles_cache = (snapshot, profiles)
         return profiles
 
     async def _test_immich_connection(self, url: str, api_key: str) -> bool:
-        """Test connection to Immich server."""
+        """Test connection to Immich server (url without trailing slash)."""
+        session = async_get_clientsession(self.hass)
+        ping_url = f"{url}/api/server/ping"
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {"x-api-key": api_key}
-                async with session.get(
-                    f"{url.rstrip('/')}/api/server/ping",
-                    headers=headers,
-                    timeout=10,
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return data.get("res") == "pong"
+            headers = {"x-api-key": api_key}
+            async with asyncio.timeout(10), session.get(
+                ping_url, headers=headers
+            ) as resp:
+                if resp.status == 200:
+                    # The reply is just {"res":"pong"}
+                    data = json.loads(await resp.read())
+                    return isinstance(data, dict) and data.get("res") == "pong"
         except Exception as e:
             _LOGGER.error("Failed to connect to Immich: %s", e)
         return False
@@ -430,7 +542,9 @@ class HubOptionsFlow(OptionsFlow):
     def __init__(self, config_entry: ConfigEntry) -> None:
         """Initialize options flow."""
         self._config_entry = config_entry
-        self._devices = dict(config_entry.data.get(CONF_DEVICES, {}))
+        # Copied on first change, most flows only read
+        self._devices = config_entry.data.get(CONF_DEVICES, {})
+        self._devices_dirty = False
         self._editing_device: str | None = None
     
     @property
@@ -441,6 +555,13 @@ class HubOptionsFlow(OptionsFlow):
         except AttributeError:
             return self._config_entry
 
+    def _mut_devices(self) -> dict[str, Any]:
+        """Get the devices dict for modification."""
+        if not self._devices_dirty:
+            self._devices = dict(self._devices)
+            self._devices_dirty = True
+        return self._devices
+
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -450,7 +571,7 @@ class HubOptionsFlow(OptionsFlow):
         if not self._devices:
             return self.async_show_form(
                 step_id="init",
-                data_schema=vol.Schema({}),
+                data_schema=_EMPTY_SCHEMA,
                 description_placeholders={"devices": device_list},
             )
         
@@ -463,12 +584,7 @@ class HubOptionsFlow(OptionsFlow):
         
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema({
-                vol.Required("action"): vol.In({
-                    "edit": "Edit device",
-                    "delete": "Delete device",
-                }),
-            }),
+            data_schema=_DEVICE_ACTION_SCHEMA,
             description_placeholders={"devices": device_list},
         )
 
@@ -500,27 +616,14 @@ class HubOptionsFlow(OptionsFlow):
         device = self._devices.get(device_id, {})
         
         # Get all profiles
-        all_profiles = {}
-        for entry in self.hass.config_entries.async_entries(DOMAIN):
-            if entry.data.get("entry_type") == ENTRY_TYPE_IMMICH:
-                immich_name = entry.data.get(CONF_IMMICH_NAME, "Immich")
-                for profile_name in entry.data.get(CONF_PROFILES, {}).keys():
-                    profile_id = generate_profile_id(entry.entry_id, profile_name)
-                    all_profiles[profile_id] = f"{immich_name} / {profile_name}"
+        all_profiles = _collect_profiles(self.hass.config_entries.async_entries(DOMAIN))
         
         if user_input is not None:
-            self._devices[device_id] = {
+            self._mut_devices()[device_id] = {
                 **device,
                 CONF_DEVICE_NAME: user_input.get(CONF_DEVICE_NAME, device_id),
                 CONF_PROFILE_ID: user_input.get(CONF_PROFILE_ID),
-                CONF_CLOCK: user_input.get(CONF_CLOCK, DEFAULT_CLOCK),
-                CONF_CLOCK_POSITION: user_input.get(CONF_CLOCK_POSITION, DEFAULT_CLOCK_POSITION),
-                CONF_CLOCK_FORMAT: user_input.get(CONF_CLOCK_FORMAT, DEFAULT_CLOCK_FORMAT),
-                CONF_CLOCK_FONT_SIZE: user_input.get(CONF_CLOCK_FONT_SIZE, DEFAULT_CLOCK_FONT_SIZE),
-                CONF_DATE: user_input.get(CONF_DATE, DEFAULT_DATE),
-                CONF_DATE_FORMAT: user_input.get(CONF_DATE_FORMAT, DEFAULT_DATE_FORMAT),
-                CONF_INTERVAL: user_input.get(CONF_INTERVAL, DEFAULT_INTERVAL),
-                CONF_PAN_SPEED: user_input.get(CONF_PAN_SPEED, DEFAULT_PAN_SPEED),
+                **{key: user_input.get(key, default) for key, default in _DEVICE_FIELDS},
             }
             
             return await self._save_and_finish()
@@ -533,13 +636,13 @@ class HubOptionsFlow(OptionsFlow):
                 vol.Optional(CONF_DEVICE_NAME, default=device.get(CONF_DEVICE_NAME, device_id)): str,
                 vol.Required(CONF_PROFILE_ID, default=current_profile): vol.In(all_profiles),
                 vol.Optional(CONF_CLOCK, default=device.get(CONF_CLOCK, DEFAULT_CLOCK)): bool,
-                vol.Optional(CONF_CLOCK_POSITION, default=device.get(CONF_CLOCK_POSITION, DEFAULT_CLOCK_POSITION)): vol.In(CLOCK_POSITIONS),
-                vol.Optional(CONF_CLOCK_FORMAT, default=device.get(CONF_CLOCK_FORMAT, DEFAULT_CLOCK_FORMAT)): vol.In(["12h", "24h"]),
+                vol.Optional(CONF_CLOCK_POSITION, default=device.get(CONF_CLOCK_POSITION, DEFAULT_CLOCK_POSITION)): _CLOCK_POSITION_VAL,
+                vol.Optional(CONF_CLOCK_FORMAT, default=device.get(CONF_CLOCK_FORMAT, DEFAULT_CLOCK_FORMAT)): _CLOCK_FORMAT_VAL,
                 vol.Optional(CONF_CLOCK_FONT_SIZE, default=device.get(CONF_CLOCK_FONT_SIZE, DEFAULT_CLOCK_FONT_SIZE)): int,
                 vol.Optional(CONF_DATE, default=device.get(CONF_DATE, DEFAULT_DATE)): bool,
-                vol.Optional(CONF_DATE_FORMAT, default=device.get(CONF_DATE_FORMAT, DEFAULT_DATE_FORMAT)): vol.In(DATE_FORMATS),
+                vol.Optional(CONF_DATE_FORMAT, default=device.get(CONF_DATE_FORMAT, DEFAULT_DATE_FORMAT)): _DATE_FORMAT_VAL,
                 vol.Optional(CONF_INTERVAL, default=device.get(CONF_INTERVAL, DEFAULT_INTERVAL)): int,
-                vol.Optional(CONF_PAN_SPEED, default=device.get(CONF_PAN_SPEED, DEFAULT_PAN_SPEED)): vol.Coerce(float),
+                vol.Optional(CONF_PAN_SPEED, default=device.get(CONF_PAN_SPEED, DEFAULT_PAN_SPEED)): _FLOAT_COERCE,
             }),
             description_placeholders={"device_id": device_id},
         )
@@ -549,7 +652,7 @@ class HubOptionsFlow(OptionsFlow):
     ) -> ConfigFlowResult:
         """Select device to delete."""
         if user_input is not None:
-            del self._devices[user_input["device"]]
+            del self._mut_devices()[user_input["device"]]
             return await self._save_and_finish()
         
         device_options = {
@@ -566,18 +669,25 @@ class HubOptionsFlow(OptionsFlow):
 
     async def _save_and_finish(self) -> ConfigFlowResult:
         """Save devices and finish."""
-        new_data = dict(self._entry.data)
-        new_data[CONF_DEVICES] = self._devices
-        
-        self.hass.config_entries.async_update_entry(
-            self._entry,
-            data=new_data,
-        )
+        if self._devices_dirty:
+            new_data = dict(self._entry.data)
+            new_data[CONF_DEVICES] = self._devices
+            
+            self.hass.config_entries.async_update_entry(
+                self._entry,
+                data=new_data,
+            )
         
         # Push config to all devices
         from . import push_config_to_device
-        for device_id in self._devices:
-            await push_config_to_device(self.hass, device_id)
+        device_ids = list(self._devices)
+        results = await asyncio.gather(
+            *(push_config_to_device(self.hass, device_id) for device_id in device_ids),
+            return_exceptions=True,
+        )
+        for device_id, result in zip(device_ids, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Failed to push config to %s: %s", device_id, result)
         
         return self.async_create_entry(title="", data={})
 
@@ -588,7 +698,9 @@ class ImmichOptionsFlow(OptionsFlow):
     def __init__(self, config_entry: ConfigEntry) -> None:
         """Initialize options flow."""
         self._config_entry = config_entry
-        self._profiles = dict(config_entry.data.get(CONF_PROFILES, {}))
+        # Copied on first change, most flows only read
+        self._profiles = config_entry.data.get(CONF_PROFILES, {})
+        self._profiles_dirty = False
         self._editing_profile: str | None = None
     
     @property
@@ -599,6 +711,13 @@ class ImmichOptionsFlow(OptionsFlow):
         except AttributeError:
             return self._config_entry
 
+    def _mut_profiles(self) -> dict[str, Any]:
+        """Get the profiles dict for modification."""
+        if not self._profiles_dirty:
+            self._profiles = dict(self._profiles)
+            self._profiles_dirty = True
+        return self._profiles
+
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -625,13 +744,7 @@ class ImmichOptionsFlow(OptionsFlow):
         
         return self.async_show_form(
             step_id="manage_profiles",
-            data_schema=vol.Schema({
-                vol.Required("action"): vol.In({
-                    "add": "Add new profile",
-                    "edit": "Edit profile",
-                    "delete": "Delete profile",
-                }),
-            }),
+            data_schema=_PROFILE_ACTION_SCHEMA,
             description_placeholders={"profiles": profile_list},
         )
 
@@ -641,26 +754,13 @@ class ImmichOptionsFlow(OptionsFlow):
         """Add a new profile."""
         if user_input is not None:
             profile_name = user_input[CONF_PROFILE_NAME]
-            search_input = user_input.get(CONF_SEARCH_FILTER, "")
-            search_filter = parse_immich_search_input(search_input) if search_input else {}
-            exclude_paths = [p.strip() for p in user_input.get(CONF_EXCLUDE_PATHS, "").split(",") if p.strip()]
-
-            self._profiles[profile_name] = {
-                CONF_SEARCH_FILTER: search_filter,
-                CONF_EXCLUDE_PATHS: exclude_paths,
-                CONF_MEDIA_TYPE: user_input.get(CONF_MEDIA_TYPE, DEFAULT_MEDIA_TYPE),
-            }
+            self._mut_profiles()[profile_name] = _build_profile(user_input)
 
             return await self._save_and_finish()
 
         return self.async_show_form(
             step_id="add_profile",
-            data_schema=vol.Schema({
-                vol.Required(CONF_PROFILE_NAME): str,
-                vol.Optional(CONF_SEARCH_FILTER, default=""): str,
-                vol.Optional(CONF_EXCLUDE_PATHS, default=""): str,
-                vol.Optional(CONF_MEDIA_TYPE, default=DEFAULT_MEDIA_TYPE): vol.In(MEDIA_TYPES),
-            }),
+            data_schema=_ADD_PROFILE_SCHEMA,
         )
 
     async def async_step_select_profile_edit(
@@ -689,20 +789,15 @@ class ImmichOptionsFlow(OptionsFlow):
         profile = self._profiles.get(profile_name, {})
         
         if user_input is not None:
-            search_input = user_input.get(CONF_SEARCH_FILTER, "")
-            search_filter = parse_immich_search_input(search_input) if search_input else {}
-            exclude_paths = [p.strip() for p in user_input.get(CONF_EXCLUDE_PATHS, "").split(",") if p.strip()]
-
-            self._profiles[profile_name] = {
-                CONF_SEARCH_FILTER: search_filter,
-                CONF_EXCLUDE_PATHS: exclude_paths,
-                CONF_MEDIA_TYPE: user_input.get(CONF_MEDIA_TYPE, DEFAULT_MEDIA_TYPE),
-            }
+            self._mut_profiles()[profile_name] = _build_profile(user_input)
 
             return await self._save_and_finish()
 
-        existing_filter = profile.get(CONF_SEARCH_FILTER, {})
-        filter_str = json.dumps(existing_filter) if existing_filter else ""
+        filter_str = profile.get(CONF_SEARCH_FILTER_RAW)
+        if filter_str is None:
+            # Profiles created before the raw filter was stored
+            existing_filter = profile.get(CONF_SEARCH_FILTER, {})
+            filter_str = json.dumps(existing_filter) if existing_filter else ""
         current_media_type = profile.get(CONF_MEDIA_TYPE, DEFAULT_MEDIA_TYPE)
 
         return self.async_show_form(
@@ -710,7 +805,7 @@ class ImmichOptionsFlow(OptionsFlow):
             data_schema=vol.Schema({
                 vol.Optional(CONF_SEARCH_FILTER, default=filter_str): str,
                 vol.Optional(CONF_EXCLUDE_PATHS, default=", ".join(profile.get(CONF_EXCLUDE_PATHS, []))): str,
-                vol.Optional(CONF_MEDIA_TYPE, default=current_media_type): vol.In(MEDIA_TYPES),
+                vol.Optional(CONF_MEDIA_TYPE, default=current_media_type): _MEDIA_TYPE_VAL,
             }),
             description_placeholders={"profile_name": profile_name},
         )
@@ -735,7 +830,7 @@ class ImmichOptionsFlow(OptionsFlow):
                 device_registry.async_remove_device(device.id)
                 _LOGGER.debug("Removed device for profile: %s", profile_name)
             
-            del self._profiles[profile_name]
+            del self._mut_profiles()[profile_name]
             return await self._save_and_finish()
         
         return self.async_show_form(
@@ -773,15 +868,16 @@ class ImmichOptionsFlow(OptionsFlow):
 
     async def _save_and_finish(self) -> ConfigFlowResult:
         """Save profiles and finish."""
-        new_data = dict(self._entry.data)
-        new_data[CONF_PROFILES] = self._profiles
-        
-        self.hass.config_entries.async_update_entry(
-            self._entry,
-            data=new_data,
-        )
-        
-        # Reload to update profile devices
-        await self.hass.config_entries.async_reload(self._entry.entry_id)
+        if self._profiles_dirty:
+            new_data = dict(self._entry.data)
+            new_data[CONF_PROFILES] = self._profiles
+            
+            self.hass.config_entries.async_update_entry(
+                self._entry,
+                data=new_data,
+            )
+            
+            # Reload to update profile devices
+            await self.hass.config_entries.async_reload(self._entry.entry_id)
         
         return self.async_create_entry(title="", data={})
@@ -1,4 +1,5 @@
 """Constants for PhotoDream integration."""
+from types import MappingProxyType
 from typing import Final
 
 DOMAIN: Final = "photo_dream"
@@ -39,6 +40,7 @@ CONF_DISPLAY_MODE: Final = "display_mode"
 CONF_PROFILE_NAME: Final = "name"
 CONF_PROFILE_ID: Final = "profile_id"
 CONF_SEARCH_FILTER: Final = "search_filter"
+CONF_SEARCH_FILTER_RAW: Final = "search_filter_raw"
 CONF_EXCLUDE_PATHS: Final = "exclude_paths"
 CONF_MEDIA_TYPE: Final = "media_type"
 
@@ -64,7 +66,7 @@ DEFAULT_PAN_SPEED: Final = 0.5
 DEFAULT_DISPLAY_MODE: Final = "smart_shuffle"
 
 # Clock positions (0-6)
-CLOCK_POSITIONS: Final = {
+CLOCK_POSITIONS: Final = MappingProxyType({
     0: "Top Left",
     1: "Top Center",
     2: "Top Right",
@@ -72,17 +74,17 @@ CLOCK_POSITIONS: Final = {
     4: "Bottom Center",
     5: "Bottom Right",
     6: "Center",
-}
+})
 
 # Date formats
-DATE_FORMATS: Final = {
+DATE_FORMATS: Final = MappingProxyType({
     "dd.MM.yyyy": "31.12.2025",
     "MM/dd/yyyy": "12/31/2025",
     "yyyy-MM-dd": "2025-12-31",
     "dd MMM yyyy": "31 Dec 2025",
     "EEEE, dd.MM.": "Wednesday, 31.12.",
     "EEE, dd.MM.": "Wed, 31.12.",
-}
+})
 
 # Services
 SERVICE_NEXT_IMAGE: Final = "next_image"
@@ -108,6 +110,16 @@ WEBHOOK_REGISTER: Final = "photo_dream_register"
 WEBHOOK_STATUS: Final = "photo_dream_status"
 WEBHOOK_KEY_EVENT: Final = "photo_dream_key_event"
 
+# Bus events
+EVENT_DEVICE_DISCOVERED: Final = "photo_dream_device_discovered"
+EVENT_DEVICE_UPDATE: Final = "photo_dream_device_update"
+EVENT_KEY_EVENT: Final = "photo_dream_key_event"
+EVENT_BRIGHTNESS_CHANGED: Final = "photo_dream_brightness_changed"
+
+# Dispatcher signals (formatted with the device_id)
+SIGNAL_DEVICE_UPDATE: Final = "photo_dream_device_update_{}"
+SIGNAL_WEATHER_UPDATED: Final = "photo_dream_weather_updated"
+
 # Weather config
 CONF_WEATHER_ENTITY: Final = "weather_entity"
 CONF_WEATHER_ENABLED: Final = "weather_enabled"
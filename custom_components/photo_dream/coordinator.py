@@ -2,15 +2,22 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
+import re
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any
 
 import aiohttp
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
@@ -26,17 +33,53 @@ from .const import (
     DEFAULT_MEDIA_TYPE,
     CONF_DEVICES,
 )
-from . import parse_immich_url
-import fnmatch
+from . import get_device_data, parse_immich_url
+from .config_flow import generate_profile_id
 
 _LOGGER = logging.getLogger(__name__)
 
 # Poll interval for checking image counts
 SCAN_INTERVAL = timedelta(hours=1)
 
+# Immich timeouts: fail fast on dead connections and stalled reads, and
+# bound each request so a hung server can't hold a request slot for long
+IMMICH_TIMEOUT = aiohttp.ClientTimeout(total=60, connect=10, sock_connect=10, sock_read=30)
+
+# Backoff before retrying a failed or timed out connection attempt (seconds);
+# read and total timeouts are not retried, the server may still be working
+IMMICH_RETRY_DELAYS = (0.3, 0.9, 2.7)
+
+# Max profile count queries running against Immich at once
+MAX_CONCURRENT_REQUESTS = 4
+
+# Safety limit when counting by pages (200 pages = 200k images max)
+MAX_COUNT_PAGES = 200
+
+# Minimum time between refreshes of an unchanged configuration (seconds)
+MIN_REFRESH_INTERVAL = 60
+
+# Reuse image counts for identical queries for this long (seconds)
+COUNT_CACHE_TTL = 300
+COUNT_CACHE_SIZE = 32
+
 # Delay between tablet refreshes (seconds)
 TABLET_REFRESH_STAGGER = 25
 
+# Poll interval for the tablets' auto-brightness state
+BRIGHTNESS_SCAN_INTERVAL = timedelta(seconds=30)
+
+
+def _query_key(
+    immich_url: str, search_filter: dict, exclude_paths: list[str], media_type: str
+) -> str:
+    """Build a key identifying an image count query."""
+    return hashlib.blake2b(
+        json.dumps(
+            [immich_url, search_filter, exclude_paths, media_type], sort_keys=True
+        ).encode(),
+        digest_size=16,
+    ).hexdigest()
+
 
 class ImmichCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to poll Immich for profile image counts."""
@@ -44,8 +87,16 @@ class ImmichCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
         self.entry = entry
+        self._session = async_get_clientsession(hass)
+        self._request_limit = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._statistics_supported = True
+        self._count_cache: OrderedDict[str, tuple[float, int]] = OrderedDict()
+        self._config_hash = ""
+        self._refresh_task: asyncio.Task | None = None
+        self._last_refresh = 0.0
         self._previous_counts: dict[str, int] = {}
         self.last_update_success_time: datetime | None = None
+        self._load_settings()
         
         super().__init__(
             hass,
@@ -53,64 +104,145 @@ class ImmichCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             name=f"PhotoDream Immich ({entry.data.get('immich_name', 'Unknown')})",
             update_interval=SCAN_INTERVAL,
         )
+        
+        # Settings can be edited without a reload
+        entry.async_on_unload(entry.add_update_listener(self._async_entry_updated))
+
+    def _load_settings(self) -> None:
+        """Cache the Immich connection settings from the entry."""
+        self._immich_url = self.entry.data.get(CONF_IMMICH_URL, "").rstrip("/")
+        self._api_key = self.entry.data.get(CONF_IMMICH_API_KEY, "")
+        self._headers = {"x-api-key": self._api_key, "Content-Type": "application/json"}
+
+    async def _async_entry_updated(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Handle config entry updates."""
+        self._load_settings()
+        if self.update_interval is None and entry.data.get(CONF_PROFILES):
+            self.update_interval = SCAN_INTERVAL
+            await self.async_request_refresh()
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch image counts for all profiles."""
-        immich_url = self.entry.data.get(CONF_IMMICH_URL, "").rstrip("/")
-        api_key = self.entry.data.get(CONF_IMMICH_API_KEY, "")
+        immich_url = self._immich_url
         profiles = self.entry.data.get(CONF_PROFILES, {})
         
-        if not immich_url or not api_key:
+        if not profiles:
+            # Nothing to poll until a profile is added
+            self.update_interval = None
+            return {}
+        
+        if not immich_url or not self._api_key:
             raise UpdateFailed("Immich URL or API key not configured")
         
+        # Skip back-to-back refreshes of an unchanged configuration
+        config_hash = hashlib.blake2b(
+            json.dumps([immich_url, profiles], sort_keys=True, default=str).encode(),
+            digest_size=8,
+        ).hexdigest()
+        if (
+            self.data is not None
+            and config_hash == self._config_hash
+            and time.monotonic() - self._last_refresh < MIN_REFRESH_INTERVAL
+        ):
+            _LOGGER.debug("Profiles unchanged since last refresh, skipping")
+            return self.data
+        
         result = {}
         counts_changed = False
         
+        # Profiles with identical queries share a single request
+        profile_keys: dict[str, str] = {}
+        queries: dict[str, tuple[dict, list[str], str]] = {}
         for profile_name, profile_config in profiles.items():
-            raw_filter = profile_config.get(CONF_SEARCH_FILTER, {})
-            search_filter = parse_immich_url(raw_filter)
-            exclude_paths = profile_config.get(CONF_EXCLUDE_PATHS, [])
-            media_type = profile_config.get(CONF_MEDIA_TYPE, DEFAULT_MEDIA_TYPE)
-
-            try:
-                count = await self._get_image_count(immich_url, api_key, search_filter, exclude_paths, media_type)
-                profile_id = f"{self.entry.entry_id}_{profile_name}".replace(" ", "_").lower()
-                
-                result[profile_name] = {
-                    "image_count": count,
-                    "profile_id": profile_id,
-                }
-                
-                # Check if count changed
-                old_count = self._previous_counts.get(profile_name)
-                if old_count is not None and old_count != count:
-                    _LOGGER.info(
-                        "Profile '%s' image count changed: %d -> %d",
-                        profile_name, old_count, count
-                    )
-                    counts_changed = True
-                
-                self._previous_counts[profile_name] = count
-                
-            except (Exception, asyncio.CancelledError) as e:
-                _LOGGER.error("Failed to get image count for profile '%s': %s", profile_name, e)
+            query = (
+                parse_immich_url(profile_config.get(CONF_SEARCH_FILTER, {})),
+                profile_config.get(CONF_EXCLUDE_PATHS, []),
+                profile_config.get(CONF_MEDIA_TYPE, DEFAULT_MEDIA_TYPE),
+            )
+            key = _query_key(immich_url, *query)
+            profile_keys[profile_name] = key
+            queries.setdefault(key, query)
+        
+        # Query all distinct filters concurrently
+        results = await asyncio.gather(
+            *(
+                self._get_image_count_cached(key, immich_url, *query)
+                for key, query in queries.items()
+            ),
+            return_exceptions=True,
+        )
+        counts = dict(zip(queries, results))
+        
+        for profile_name, key in profile_keys.items():
+            count = counts[key]
+            profile_id = generate_profile_id(self.entry.entry_id, profile_name)
+            
+            if isinstance(count, BaseException):
+                _LOGGER.error("Failed to get image count for profile '%s': %s", profile_name, count)
                 result[profile_name] = {
                     "image_count": None,
-                    "profile_id": f"{self.entry.entry_id}_{profile_name}".replace(" ", "_").lower(),
-                    "error": str(e),
+                    "profile_id": profile_id,
+                    "error": str(count),
                 }
+                continue
+            
+            result[profile_name] = {
+                "image_count": count,
+                "profile_id": profile_id,
+            }
+            
+            # Check if count changed
+            old_count = self._previous_counts.get(profile_name)
+            if old_count is not None and old_count != count:
+                _LOGGER.info(
+                    "Profile '%s' image count changed: %d -> %d",
+                    profile_name, old_count, count
+                )
+                counts_changed = True
+            
+            self._previous_counts[profile_name] = count
         
         # If any count changed, trigger tablet refreshes
         if counts_changed:
-            self.hass.async_create_task(self._refresh_all_tablets())
+            # A new wave supersedes any refreshes still waiting from the last one
+            if self._refresh_task is not None and not self._refresh_task.done():
+                self._refresh_task.cancel()
+            # Bound to the entry so pending refreshes are cancelled on unload
+            self._refresh_task = self.entry.async_create_background_task(
+                self.hass, self._refresh_all_tablets(), "photo_dream tablet refresh"
+            )
         
         # Update success time
         self.last_update_success_time = dt_util.utcnow()
+        self._config_hash = config_hash
+        self._last_refresh = time.monotonic()
         
         return result
 
+    async def _get_image_count_cached(
+        self, key: str, immich_url: str, search_filter: dict, exclude_paths: list[str],
+        media_type: str = DEFAULT_MEDIA_TYPE,
+    ) -> int:
+        """Get an image count, reusing recent results for the same query key."""
+        cached = self._count_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < COUNT_CACHE_TTL:
+            self._count_cache.move_to_end(key)
+            return cached[1]
+        
+        # Limit concurrent requests to Immich
+        async with self._request_limit:
+            count = await self._get_image_count(
+                immich_url, search_filter, exclude_paths, media_type
+            )
+        
+        self._count_cache[key] = (time.monotonic(), count)
+        self._count_cache.move_to_end(key)
+        while len(self._count_cache) > COUNT_CACHE_SIZE:
+            self._count_cache.popitem(last=False)
+        return count
+
     async def _get_image_count(
-        self, immich_url: str, api_key: str, search_filter: dict, exclude_paths: list[str],
+        self, immich_url: str, search_filter: dict, exclude_paths: list[str],
         media_type: str = DEFAULT_MEDIA_TYPE,
     ) -> int:
         """Query Immich API to get image count for a search filter.
@@ -118,11 +250,10 @@ class ImmichCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         If exclude_paths is empty, uses fast /api/search/statistics endpoint.
         If exclude_paths is set, fetches all assets and filters client-side.
         """
-        headers = {"x-api-key": api_key, "Content-Type": "application/json"}
+        headers = self._headers
 
         # Fast path: no excludes, use statistics endpoint
         if not exclude_paths:
-            url = f"{immich_url}/api/search/statistics"
             payload = dict(search_filter) if search_filter else {}
             if media_type == "image":
                 payload["type"] = "IMAGE"
@@ -130,38 +261,75 @@ class ImmichCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 payload["type"] = "VIDEO"
             # 'both' -> omit type field
 
+            total = await self._get_statistics_total(immich_url, headers, payload)
+            if total is not None:
+                _LOGGER.debug("Image count for filter (fast): %d", total)
+                return total
+
+        # Slow path: has excludes (or no statistics endpoint), need to fetch and filter
+        return await self._get_filtered_count(immich_url, search_filter, exclude_paths, media_type)
+    
+    async def _get_statistics_total(
+        self, immich_url: str, headers: dict[str, str], payload: dict[str, Any]
+    ) -> int | None:
+        """Get the total asset count from /api/search/statistics.
+
+        Returns None if the Immich server doesn't provide the endpoint.
+        """
+        if not self._statistics_supported:
+            return None
+        
+        status, data = await self._post(
+            f"{immich_url}/api/search/statistics", headers, payload
+        )
+        if status == 200:
+            return data.get("total", 0)
+        if status == 404:
+            # Older Immich server, remember and paginate from now on
+            _LOGGER.warning("Immich statistics endpoint not available, counting by pages")
+            self._statistics_supported = False
+            return None
+        _LOGGER.error("Immich API error %d: %s", status, data)
+        raise UpdateFailed(f"Immich API returned {status}")
+
+    async def _post(
+        self, url: str, headers: dict[str, str], payload: dict[str, Any]
+    ) -> tuple[int, Any]:
+        """POST to Immich, retrying requests that failed to connect.
+
+        Returns the HTTP status with the decoded JSON body, or the response
+        text if the request was not successful.
+        """
+        for delay in (*IMMICH_RETRY_DELAYS, None):
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        url,
-                        headers=headers,
-                        json=payload,
-                        timeout=aiohttp.ClientTimeout(total=30),
-                    ) as resp:
-                        if resp.status == 200:
-                            data = await resp.json()
-                            total = data.get("total", 0)
-                            _LOGGER.debug("Image count for filter (fast): %d", total)
-                            return total
-                        else:
-                            text = await resp.text()
-                            _LOGGER.error("Immich API error %d: %s", resp.status, text)
-                            raise UpdateFailed(f"Immich API returned {resp.status}")
+                async with self._session.post(
+                    url, headers=headers, json=payload, timeout=IMMICH_TIMEOUT
+                ) as resp:
+                    if resp.status != 200:
+                        return resp.status, await resp.text()
+                    return resp.status, await resp.json(loads=json_loads)
+            except (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError) as e:
+                if delay is None:
+                    raise UpdateFailed(f"Cannot connect to Immich: {e}") from e
+                _LOGGER.debug("Immich request failed (%s), retrying in %.1fs", e, delay)
+                await asyncio.sleep(delay)
+            except asyncio.TimeoutError as e:
+                raise UpdateFailed("Timeout waiting for Immich to respond") from e
             except aiohttp.ClientError as e:
-                raise UpdateFailed(f"Cannot connect to Immich: {e}")
+                raise UpdateFailed(f"Cannot connect to Immich: {e}") from e
 
-        # Slow path: has excludes, need to fetch and filter
-        return await self._get_filtered_count(immich_url, api_key, search_filter, exclude_paths, media_type)
-    
     async def _get_filtered_count(
-        self, immich_url: str, api_key: str, search_filter: dict, exclude_paths: list[str],
+        self, immich_url: str, search_filter: dict, exclude_paths: list[str],
         media_type: str = DEFAULT_MEDIA_TYPE,
     ) -> int:
         """Fetch all assets and count after applying exclude_paths filter."""
-        headers = {"x-api-key": api_key, "Content-Type": "application/json"}
+        headers = self._headers
 
-        # Convert exclude patterns (remove trailing *)
-        exclude_patterns = [p.rstrip("*").rstrip("/") for p in exclude_paths]
+        # Convert exclude patterns (remove trailing *) into a single regex
+        # matching any path that contains one of them
+        exclude_re = re.compile(
+            "|".join(re.escape(p.rstrip("*").rstrip("/")) for p in exclude_paths)
+        ) if exclude_paths else None
 
         # Map media_type to Immich API type value (None means omit field)
         immich_type: str | None
@@ -177,82 +345,71 @@ class ImmichCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         page = 1
         page_size = 1000  # Larger pages for counting
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                while True:
-                    # Use metadata search for filtered counting (smart search has CLIP limits)
-                    # If search_filter has a "query" key, use smart search; otherwise metadata
-                    has_query = search_filter and search_filter.get("query")
-
-                    if has_query:
-                        url = f"{immich_url}/api/search/smart"
-                        payload = {
-                            "query": search_filter["query"],
-                            "page": page,
-                            "size": page_size,
-                        }
-                        if immich_type is not None:
-                            payload["type"] = immich_type
-                    else:
-                        url = f"{immich_url}/api/search/metadata"
-                        payload = {
-                            "page": page,
-                            "size": page_size,
-                        }
-                        if immich_type is not None:
-                            payload["type"] = immich_type
-                    
-                    # Add optional filters
-                    if search_filter:
-                        for key in ["personIds", "tagIds", "albumId", "city", "country", 
-                                    "state", "takenAfter", "takenBefore", "isArchived", "isFavorite"]:
-                            if key in search_filter and search_filter[key] is not None:
-                                payload[key] = search_filter[key]
-                    
-                    async with session.post(url, headers=headers, json=payload, timeout=aiohttp.ClientTimeout(total=60)) as resp:
-                        if resp.status != 200:
-                            text = await resp.text()
-                            _LOGGER.error("Immich search API error %d: %s", resp.status, text)
-                            raise UpdateFailed(f"Immich API returned {resp.status}")
-                        
-                        data = await resp.json()
-                        assets = data.get("assets", {}).get("items", [])
-                        
-                        if not assets:
-                            break
-                        
-                        # Filter out excluded paths
-                        for asset in assets:
-                            original_path = asset.get("originalPath", "")
-                            is_excluded = any(
-                                original_path.startswith(pattern) or pattern in original_path
-                                for pattern in exclude_patterns
-                            )
-                            
-                            if is_excluded:
-                                excluded_count += 1
-                            else:
-                                total_count += 1
-                        
-                        # Check if more pages (API total is unreliable, use item count)
-                        if len(assets) < page_size:
-                            break
-                        
-                        page += 1
-                        
-                        # Safety limit (200 pages = 200k images max)
-                        if page > 200:
-                            _LOGGER.warning("Reached pagination limit (200 pages) while counting")
-                            break
-                
-                _LOGGER.debug(
-                    "Image count with excludes: %d (excluded %d)", 
-                    total_count, excluded_count
-                )
-                return total_count
-                
-        except aiohttp.ClientError as e:
-            raise UpdateFailed(f"Cannot connect to Immich: {e}")
+        # Filters shared by every page request
+        filters: dict[str, Any] = {}
+        if immich_type is not None:
+            filters["type"] = immich_type
+        if search_filter:
+            for key in ["personIds", "tagIds", "albumId", "city", "country", 
+                        "state", "takenAfter", "takenBefore", "isArchived", "isFavorite"]:
+                if key in search_filter and search_filter[key] is not None:
+                    filters[key] = search_filter[key]
+
+        # Use metadata search for filtered counting (smart search has CLIP limits)
+        # If search_filter has a "query" key, use smart search; otherwise metadata
+        has_query = search_filter and search_filter.get("query")
+
+        if has_query:
+            url = f"{immich_url}/api/search/smart"
+            payload = {"query": search_filter["query"], "size": page_size, **filters}
+        else:
+            url = f"{immich_url}/api/search/metadata"
+            payload = {"size": page_size, **filters}
+
+        while True:
+            # Only the page number changes between requests
+            payload["page"] = page
+            status, data = await self._post(url, headers, payload)
+            if status != 200:
+                _LOGGER.error("Immich search API error %d: %s", status, data)
+                raise UpdateFailed(f"Immich API returned {status}")
+            
+            # Only the paths are needed, so reduce the page to them and drop
+            # the decoded response before the next page is requested
+            paths = [
+                asset.get("originalPath", "")
+                for asset in data.get("assets", {}).get("items", [])
+            ]
+            del data
+            page_count = len(paths)
+            
+            if not page_count:
+                break
+            
+            # Filter out excluded paths
+            page_excluded = sum(
+                1 for original_path in paths if exclude_re.search(original_path)
+            ) if exclude_re else 0
+            del paths
+            excluded_count += page_excluded
+            total_count += page_count - page_excluded
+            
+            # Check if more pages (API total is unreliable, use item count)
+            if page_count < page_size:
+                break
+            
+            page += 1
+            
+            # Safety limit
+            if page > MAX_COUNT_PAGES:
+                _LOGGER.warning("Reached pagination limit (%d pages) while counting", MAX_COUNT_PAGES)
+                break
+        
+        _LOGGER.debug(
+            "Image count with excludes: %d (excluded %d)", 
+            total_count, excluded_count
+        )
+        return total_count
 
     async def _refresh_all_tablets(self) -> None:
         """Refresh all tablets with staggered timing."""
@@ -273,24 +430,20 @@ class ImmichCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Import here to avoid circular imports
         from . import push_config_to_device
         
-        for i, device_id in enumerate(devices.keys()):
+        # First tablet immediately, the others staggered relative to the start
+        start = self.hass.loop.time()
+        for i, device_id in enumerate(list(devices)):
             if i > 0:
-                # Stagger refreshes
-                delay = TABLET_REFRESH_STAGGER + (i * 5)  # 25s, 30s, 35s, etc.
-                _LOGGER.debug("Scheduling refresh for %s in %d seconds", device_id, delay)
-                self.hass.loop.call_later(
-                    delay,
-                    lambda did=device_id: self.hass.async_create_task(
-                        push_config_to_device(self.hass, did)
-                    ),
-                )
-            else:
-                # First tablet immediately
-                await push_config_to_device(self.hass, device_id)
+                delay = TABLET_REFRESH_STAGGER + (i * 5)  # 30s, 35s, 40s, etc.
+                _LOGGER.debug("Refreshing %s in %d seconds", device_id, delay)
+                await asyncio.sleep(max(0, start + delay - self.hass.loop.time()))
+            await push_config_to_device(self.hass, device_id)
 
     async def async_manual_refresh(self) -> None:
         """Manually trigger a refresh and update tablets if count changed."""
         _LOGGER.info("Manual refresh triggered")
+        self._count_cache.clear()
+        self._last_refresh = 0.0
         await self.async_request_refresh()
 
 
@@ -302,15 +455,44 @@ async def async_get_coordinator(
     
     if entry.entry_id not in coordinators:
         coordinator = ImmichCoordinator(hass, entry)
-        try:
-            await coordinator.async_config_entry_first_refresh()
-        except (asyncio.CancelledError, TimeoutError) as err:
-            _LOGGER.warning(
-                "First data refresh timed out (%s), will retry on next interval",
-                type(err).__name__,
-            )
-            # Don't re-raise — let setup succeed with empty data.
-            # The coordinator will retry on the next update_interval.
+        # Counting every profile can take a while; don't hold up entry setup.
+        # Sensors show no count until it finishes, failures retry on the
+        # next update_interval.
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), "photo_dream first refresh"
+        )
         coordinators[entry.entry_id] = coordinator
     
     return coordinators[entry.entry_id]
+
+
+class PhotoDreamBrightnessCoordinator(DataUpdateCoordinator[dict[str, dict | None]]):
+    """Coordinator to poll the auto-brightness state of all hub tablets."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the coordinator."""
+        self.entry = entry
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="PhotoDream auto brightness",
+            update_interval=BRIGHTNESS_SCAN_INTERVAL,
+            # Entities are only notified when a tablet's state changed
+            always_update=False,
+        )
+
+    async def _async_update_data(self) -> dict[str, dict | None]:
+        """Fetch auto-brightness from all tablets concurrently."""
+        device_ids = list(self.entry.data[CONF_DEVICES])
+        results = await asyncio.gather(
+            *(
+                get_device_data(self.hass, device_id, "auto-brightness")
+                for device_id in device_ids
+            )
+        )
+        return dict(zip(device_ids, results))
+
+    async def async_refresh_device(self, device_id: str) -> None:
+        """Re-read auto-brightness from a single tablet."""
+        result = await get_device_data(self.hass, device_id, "auto-brightness")
+        self.async_set_updated_data({**(self.data or {}), device_id: result})
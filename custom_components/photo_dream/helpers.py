@@ -1,12 +1,33 @@
 """Helper functions for PhotoDream integration."""
 from __future__ import annotations
 
+import re
+import sys
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, format_mac
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN, CONF_DEVICES, CONF_DEVICE_NAME, ATTR_MAC_ADDRESS
+
+# Window in which device config changes are coalesced into one entry update
+CONFIG_UPDATE_DELAY = 0.1
+
+# Plausible MAC address as reported by tablets (with or without separators)
+_MAC_RE = re.compile(r"^[0-9A-Fa-f:.\-]{12,17}$")
 
-from .const import DOMAIN, CONF_DEVICE_NAME, ATTR_MAC_ADDRESS
+
+@lru_cache(maxsize=256)
+def _get_connections(mac_address: str) -> frozenset[tuple[str, str]] | None:
+    """Return the device registry connections for a raw MAC address."""
+    if not _MAC_RE.match(mac_address):
+        return None  # Invalid MAC format, skip
+    return frozenset({(CONNECTION_NETWORK_MAC, format_mac(mac_address))})
 
 
 def get_device_info(
@@ -19,27 +40,175 @@ def get_device_info(
     
     This allows HA to match the device with network integrations (like TP-Link Deco)
     that also know the device by its MAC address.
+    
+    The result is shared by all entities of a device and rebuilt once its
+    name or MAC address changes; the cache lives in the hub data and is
+    dropped when the hub is unloaded.
     """
+    hub_data = hass.data.get(DOMAIN, {}).get("hub") or {}
     device_name = device_config.get(CONF_DEVICE_NAME, device_id)
     
     # Try to get MAC address from device status
-    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
-    device_data = entry_data.get("devices", {}).get(device_id, {})
+    device_data = hub_data.get("devices", {}).get(device_id, {})
     mac_address = device_data.get(ATTR_MAC_ADDRESS)
     
-    # Build connections set with MAC if available
-    connections = set()
-    if mac_address:
-        try:
-            formatted_mac = format_mac(mac_address)
-            connections.add((CONNECTION_NETWORK_MAC, formatted_mac))
-        except Exception:
-            pass  # Invalid MAC format, skip
+    cache = hub_data.get("device_info")
+    source = (device_name, mac_address)
+    if cache is not None and (cached := cache.get(device_id)) and cached[0] == source:
+        return cached[1]
     
-    return DeviceInfo(
+    device_info = DeviceInfo(
         identifiers={(DOMAIN, f"{entry.entry_id}_{device_id}")},
-        connections=connections if connections else None,
         name=f"PhotoDream {device_name}",
         manufacturer="PhotoDream",
         model="Android Tablet",
     )
+    
+    # Add MAC connection only if the device reported a usable one
+    if isinstance(mac_address, str) and (connections := _get_connections(mac_address)):
+        device_info["connections"] = connections
+    if cache is not None:
+        cache[device_id] = (source, device_info)
+    return device_info
+
+
+class DeviceConfigUpdater:
+    """Batch device config changes into a single config entry update.
+    
+    Entities queue their changes here instead of each rewriting the entry
+    data. Changes made within CONFIG_UPDATE_DELAY are written together and
+    the latest value for a key wins.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the updater."""
+        self._hass = hass
+        self._entry_id = entry_id
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        # Bumped whenever a change is queued, so readers can cache configs
+        self.version = 0
+
+    @callback
+    def queue(self, entry: ConfigEntry, device_id: str, key: str, value: Any) -> bool:
+        """Queue a device config change.
+        
+        Returns False without queueing anything if the value is already set.
+        """
+        device = self.get_device_config(entry, device_id)
+        if key in device and device[key] == value:
+            return False
+        self._pending.setdefault(device_id, {})[key] = value
+        self.version += 1
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self._hass, CONFIG_UPDATE_DELAY, self._async_flush
+            )
+        return True
+
+    @callback
+    def get_device_config(self, entry: ConfigEntry, device_id: str) -> dict:
+        """Return the stored device config with queued changes applied."""
+        device = entry.data.get(CONF_DEVICES, {}).get(device_id, {})
+        pending = self._pending.get(device_id)
+        return {**device, **pending} if pending else device
+
+    @callback
+    def _async_flush(self, _now: datetime | None = None) -> None:
+        """Write all queued changes with one entry update."""
+        self._unsub_flush = None
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        
+        # Get fresh entry (not cached reference)
+        entry = self._hass.config_entries.async_get_entry(self._entry_id)
+        if not entry:
+            return
+        
+        # Copy only the branches that change; the stored dicts stay untouched.
+        # Changes for devices removed in the meantime are dropped.
+        devices = {**entry.data[CONF_DEVICES]}
+        for device_id, changes in pending.items():
+            if device_id in devices:
+                devices[device_id] = {**devices[device_id], **changes}
+        new_data = {**entry.data, CONF_DEVICES: devices}
+        self._hass.config_entries.async_update_entry(entry, data=new_data)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the pending timer and write queued changes now."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+        self._async_flush()
+
+
+class PhotoDreamDeviceEntity:
+    """Mixin for entities that read and write a tablet's device config."""
+
+    # hass and _attr_* belong to the Entity base, which keeps a __dict__
+    __slots__ = (
+        "_entry",
+        "_device_id",
+        "_devices",
+        "_config_updater",
+        "_cached_device_config",
+        "_cached_device_config_source",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        device_id: str,
+        device_config: dict,
+        device_info: DeviceInfo | None = None,
+    ) -> None:
+        """Initialize the entity."""
+        self.hass = hass
+        self._entry = entry
+        # Interned so every entity of a device shares one key string
+        self._device_id = sys.intern(device_id)
+        self._attr_device_info = device_info or get_device_info(
+            hass, entry, device_id, device_config
+        )
+        # Device config as last resolved, with the entry data and updater
+        # version it came from
+        self._cached_device_config: dict = {}
+        self._cached_device_config_source: tuple[Any, int] | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Bind the hub runtime data once instead of on every read."""
+        await super().async_added_to_hass()
+        hub_data = self.hass.data[DOMAIN]["hub"]
+        self._devices: dict[str, dict] = hub_data["devices"]
+        self._config_updater: DeviceConfigUpdater = hub_data["config_updater"]
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop references to hub data so a reloaded hub can be freed."""
+        await super().async_will_remove_from_hass()
+        self._devices = {}
+
+    def _get_device_data(self) -> dict | None:
+        """Get device runtime data."""
+        return self._devices.get(self._device_id)
+
+    def _get_device_config(self) -> dict:
+        """Get device config, including changes not yet written to the entry."""
+        # Entry updates replace entry.data, queued changes bump the version
+        source = self._cached_device_config_source
+        data = self._entry.data
+        version = self._config_updater.version
+        if source is None or source[0] is not data or source[1] != version:
+            self._cached_device_config = self._config_updater.get_device_config(
+                self._entry, self._device_id
+            )
+            self._cached_device_config_source = (data, version)
+        return self._cached_device_config
+
+    def _update_device_config(self, key: str, value: Any) -> bool:
+        """Queue a device config change for the next batched entry update.
+        
+        Returns False if the value was already set.
+        """
+        return self._config_updater.queue(self._entry, self._device_id, key, value)
@@ -2,16 +2,16 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from .helpers import get_device_info
+from .helpers import PhotoDreamDeviceEntity, get_device_info
 
 from .const import (
-    DOMAIN,
+    EVENT_BRIGHTNESS_CHANGED,
     ENTRY_TYPE_HUB,
     CONF_DEVICES,
     CONF_INTERVAL,
@@ -36,51 +36,30 @@ async def async_setup_entry(
     if entry.data.get("entry_type") != ENTRY_TYPE_HUB:
         return
     
-    devices = entry.data.get(CONF_DEVICES, {})
+    devices = entry.data[CONF_DEVICES]
+    if not devices:
+        return
     
     entities = []
     for device_id, device_config in devices.items():
-        entities.append(PhotoDreamIntervalNumber(hass, entry, device_id, device_config))
-        entities.append(PhotoDreamPanSpeedNumber(hass, entry, device_id, device_config))
-        entities.append(PhotoDreamClockFontSizeNumber(hass, entry, device_id, device_config))
-        entities.append(PhotoDreamBrightnessNumber(hass, entry, device_id, device_config))
+        # Shared by all number entities of this device
+        unique_id_prefix = f"{entry.entry_id}_{device_id}"
+        device_info = get_device_info(hass, entry, device_id, device_config)
+        entities.extend(
+            entity_class(
+                hass, entry, device_id, device_config, unique_id_prefix, device_info
+            )
+            for entity_class in NUMBER_CLASSES
+        )
     
     async_add_entities(entities)
 
 
-class PhotoDreamBaseNumber(NumberEntity):
+class PhotoDreamBaseNumber(PhotoDreamDeviceEntity, NumberEntity):
     """Base class for PhotoDream number entities."""
 
     _attr_has_entity_name = True
 
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
-        device_id: str,
-        device_config: dict,
-    ) -> None:
-        """Initialize the number entity."""
-        self.hass = hass
-        self._entry = entry
-        self._device_id = device_id
-        self._device_config = device_config
-        self._attr_device_info = get_device_info(hass, entry, device_id, device_config)
-
-    def _get_device_config(self) -> dict:
-        """Get current device config."""
-        return self._entry.data.get(CONF_DEVICES, {}).get(self._device_id, {})
-
-    def _update_device_config(self, key: str, value: Any) -> None:
-        """Update device config in entry data."""
-        new_data = dict(self._entry.data)
-        if CONF_DEVICES not in new_data:
-            new_data[CONF_DEVICES] = {}
-        if self._device_id not in new_data[CONF_DEVICES]:
-            new_data[CONF_DEVICES][self._device_id] = dict(self._device_config)
-        new_data[CONF_DEVICES][self._device_id][key] = value
-        self.hass.config_entries.async_update_entry(self._entry, data=new_data)
-
 
 class PhotoDreamIntervalNumber(PhotoDreamBaseNumber):
     """Number entity for slide interval on a PhotoDream device."""
@@ -99,10 +78,12 @@ class PhotoDreamIntervalNumber(PhotoDreamBaseNumber):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the number entity."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_interval"
+        super().__init__(hass, entry, device_id, device_config, device_info)
+        self._attr_unique_id = f"{unique_id_prefix}_interval"
 
     @property
     def native_value(self) -> float:
@@ -111,7 +92,8 @@ class PhotoDreamIntervalNumber(PhotoDreamBaseNumber):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the interval."""
-        self._update_device_config(CONF_INTERVAL, int(value))
+        if not self._update_device_config(CONF_INTERVAL, int(value)):
+            return  # Already set, nothing to write or push
         await push_config_to_device(self.hass, self._device_id)
         self.async_write_ha_state()
 
@@ -132,10 +114,12 @@ class PhotoDreamPanSpeedNumber(PhotoDreamBaseNumber):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the number entity."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_pan_speed"
+        super().__init__(hass, entry, device_id, device_config, device_info)
+        self._attr_unique_id = f"{unique_id_prefix}_pan_speed"
 
     @property
     def native_value(self) -> float:
@@ -144,7 +128,8 @@ class PhotoDreamPanSpeedNumber(PhotoDreamBaseNumber):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the pan speed."""
-        self._update_device_config(CONF_PAN_SPEED, round(value, 1))
+        if not self._update_device_config(CONF_PAN_SPEED, round(value, 1)):
+            return  # Already set, nothing to write or push
         await push_config_to_device(self.hass, self._device_id)
         self.async_write_ha_state()
 
@@ -166,10 +151,12 @@ class PhotoDreamClockFontSizeNumber(PhotoDreamBaseNumber):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the number entity."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_clock_font_size"
+        super().__init__(hass, entry, device_id, device_config, device_info)
+        self._attr_unique_id = f"{unique_id_prefix}_clock_font_size"
 
     @property
     def native_value(self) -> float:
@@ -178,7 +165,8 @@ class PhotoDreamClockFontSizeNumber(PhotoDreamBaseNumber):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the font size."""
-        self._update_device_config(CONF_CLOCK_FONT_SIZE, int(value))
+        if not self._update_device_config(CONF_CLOCK_FONT_SIZE, int(value)):
+            return  # Already set, nothing to write or push
         await push_config_to_device(self.hass, self._device_id)
         self.async_write_ha_state()
 
@@ -205,14 +193,15 @@ class PhotoDreamBrightnessNumber(NumberEntity):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the number entity."""
         self.hass = hass
         self._entry = entry
         self._device_id = device_id
-        self._device_config = device_config
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_brightness"
-        self._attr_device_info = get_device_info(hass, entry, device_id, device_config)
+        self._attr_unique_id = f"{unique_id_prefix}_brightness"
+        self._attr_device_info = device_info
         self._brightness_value: int = 50  # Default until first poll
 
     @property
@@ -238,6 +227,15 @@ class PhotoDreamBrightnessNumber(NumberEntity):
             
             # Fire event so auto-brightness switch can update
             self.hass.bus.async_fire(
-                f"{DOMAIN}_brightness_changed",
+                EVENT_BRIGHTNESS_CHANGED,
                 {"device_id": self._device_id}
             )
+
+
+# Number entities created for every device
+NUMBER_CLASSES = (
+    PhotoDreamIntervalNumber,
+    PhotoDreamPanSpeedNumber,
+    PhotoDreamClockFontSizeNumber,
+    PhotoDreamBrightnessNumber,
+)
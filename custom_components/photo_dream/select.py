@@ -7,13 +7,21 @@ from typing import Any
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from .helpers import get_device_info
+from homeassistant.helpers.event import (
+    async_track_state_added_domain,
+    async_track_state_removed_domain,
+)
+from .helpers import PhotoDreamDeviceEntity, get_device_info
 
 from .const import (
     DOMAIN,
     ENTRY_TYPE_HUB,
-    ENTRY_TYPE_IMMICH,
     CONF_DEVICES,
     CONF_PROFILES,
     CONF_PROFILE_ID,
@@ -30,22 +38,87 @@ from .const import (
     CLOCK_POSITIONS,
     DATE_FORMATS,
     ATTR_PROFILE,
+    SIGNAL_DEVICE_UPDATE,
+    SIGNAL_WEATHER_UPDATED,
 )
-from . import send_command_to_device, push_config_to_device
+from . import schedule_push_config
 
 _LOGGER = logging.getLogger(__name__)
 
+# Clock position display name -> position number
+_POSITION_REVERSE_MAP = {v: k for k, v in CLOCK_POSITIONS.items()}
 
-def get_all_profiles(hass: HomeAssistant) -> dict[str, str]:
-    """Get all profiles from all Immich instances as {profile_id: display_name}."""
-    profiles = {}
-    for entry in hass.config_entries.async_entries(DOMAIN):
-        if entry.data.get("entry_type") == ENTRY_TYPE_IMMICH:
+# Placeholder options shared by all instances
+_NO_PROFILES_OPTIONS = ("No profiles configured",)
+
+
+def _get_profiles_cache(hass: HomeAssistant) -> dict[str, dict[str, str]]:
+    """Get the shared profile maps, rebuilding them after an Immich entry changed."""
+    cache = hass.data[DOMAIN].get("profiles_cache")
+    if cache is None:
+        profiles = {}
+        displays_by_name: dict[str, str] = {}
+        # Only loaded Immich entries, indexed at their setup
+        for immich_data in hass.data[DOMAIN]["immich"].values():
+            entry = immich_data["entry"]
             immich_name = entry.data.get(CONF_IMMICH_NAME, "Immich")
             for profile_name in entry.data.get(CONF_PROFILES, {}).keys():
                 profile_id = f"{entry.entry_id}_{profile_name}".replace(" ", "_").lower()
                 profiles[profile_id] = f"{immich_name} / {profile_name}"
-    return profiles
+                # First instance wins if several share a profile name
+                displays_by_name.setdefault(profile_name, profiles[profile_id])
+        cache = {
+            "profiles": profiles,
+            "profile_ids": {display: pid for pid, display in profiles.items()},
+            "displays_by_name": displays_by_name,
+            # Shared options tuple for all profile selects
+            "options": tuple(profiles.values()) or _NO_PROFILES_OPTIONS,
+        }
+        hass.data[DOMAIN]["profiles_cache"] = cache
+    return cache
+
+
+def get_all_profiles(hass: HomeAssistant) -> dict[str, str]:
+    """Get all profiles from all Immich instances as {profile_id: display_name}."""
+    return _get_profiles_cache(hass)["profiles"]
+
+
+@callback
+def _async_track_weather_entities(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Track weather entities once per hub for all weather selects.
+    
+    The returned dict is updated in place when a weather entity is added or
+    removed, and SIGNAL_WEATHER_UPDATED is sent afterwards.
+    """
+    weather: dict[str, Any] = {}
+    
+    @callback
+    def _async_rebuild() -> None:
+        entity_map = {"None": None}
+        displays = {}
+        for state in hass.states.async_all("weather"):
+            friendly_name = state.attributes.get("friendly_name", state.entity_id)
+            display = f"{friendly_name} ({state.entity_id})"
+            entity_map[display] = state.entity_id
+            displays[state.entity_id] = display
+        weather["entity_map"] = entity_map  # {display: entity_id}
+        weather["displays"] = displays  # {entity_id: display}
+        weather["options"] = tuple(entity_map)
+        _LOGGER.debug("Weather entity options: %s", weather["options"])
+    
+    @callback
+    def _async_weather_changed(event) -> None:
+        _async_rebuild()
+        async_dispatcher_send(hass, SIGNAL_WEATHER_UPDATED)
+    
+    _async_rebuild()
+    entry.async_on_unload(
+        async_track_state_added_domain(hass, "weather", _async_weather_changed)
+    )
+    entry.async_on_unload(
+        async_track_state_removed_domain(hass, "weather", _async_weather_changed)
+    )
+    return weather
 
 
 async def async_setup_entry(
@@ -58,74 +131,47 @@ async def async_setup_entry(
     if entry.data.get("entry_type") != ENTRY_TYPE_HUB:
         return
     
-    devices = entry.data.get(CONF_DEVICES, {})
+    devices = entry.data[CONF_DEVICES]
+    if not devices:
+        return
+    
+    hass.data[DOMAIN]["hub"]["weather"] = _async_track_weather_entities(hass, entry)
     
     entities = []
     for device_id, device_config in devices.items():
-        entities.append(PhotoDreamProfileSelect(hass, entry, device_id, device_config))
-        entities.append(PhotoDreamClockPositionSelect(hass, entry, device_id, device_config))
-        entities.append(PhotoDreamClockFormatSelect(hass, entry, device_id, device_config))
-        entities.append(PhotoDreamDateFormatSelect(hass, entry, device_id, device_config))
-        entities.append(PhotoDreamDisplayModeSelect(hass, entry, device_id, device_config))
-        entities.append(PhotoDreamWeatherEntitySelect(hass, entry, device_id, device_config))
+        # Shared by all selects of this device
+        unique_id_prefix = f"{entry.entry_id}_{device_id}"
+        device_info = get_device_info(hass, entry, device_id, device_config)
+        entities.extend(
+            entity_class(
+                hass, entry, device_id, device_config, unique_id_prefix, device_info
+            )
+            for entity_class in SELECT_CLASSES
+        )
     
     async_add_entities(entities)
 
 
-class PhotoDreamBaseSelect(SelectEntity):
+class PhotoDreamBaseSelect(PhotoDreamDeviceEntity, SelectEntity):
     """Base class for PhotoDream select entities."""
 
     _attr_has_entity_name = True
 
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
-        device_id: str,
-        device_config: dict,
-    ) -> None:
-        """Initialize the select entity."""
-        self.hass = hass
-        self._entry = entry
-        self._device_id = device_id
-        self._device_config = device_config
-        self._attr_device_info = get_device_info(hass, entry, device_id, device_config)
-
-    def _get_device_data(self) -> dict | None:
-        """Get device runtime data from hass.data."""
-        hub_data = self.hass.data.get(DOMAIN, {}).get("hub")
-        if not hub_data:
-            return None
-        return hub_data.get("devices", {}).get(self._device_id)
-
-    def _get_device_config(self) -> dict:
-        """Get device config from entry data."""
-        return self._entry.data.get(CONF_DEVICES, {}).get(self._device_id, {})
-
-    def _update_device_config(self, key: str, value) -> None:
-        """Update device config in entry data."""
-        new_data = dict(self._entry.data)
-        if CONF_DEVICES not in new_data:
-            new_data[CONF_DEVICES] = {}
-        if self._device_id not in new_data[CONF_DEVICES]:
-            new_data[CONF_DEVICES][self._device_id] = dict(self._device_config)
-        new_data[CONF_DEVICES][self._device_id][key] = value
-        self.hass.config_entries.async_update_entry(self._entry, data=new_data)
-
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
+        await super().async_added_to_hass()
         self.async_on_remove(
-            self.hass.bus.async_listen(
-                f"{DOMAIN}_device_update",
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_DEVICE_UPDATE.format(self._device_id),
                 self._handle_device_update,
             )
         )
 
     @callback
-    def _handle_device_update(self, event) -> None:
+    def _handle_device_update(self, data: dict) -> None:
         """Handle device update event."""
-        if event.data.get("device_id") == self._device_id:
-            self.async_write_ha_state()
+        self.async_write_ha_state()
 
 
 class PhotoDreamProfileSelect(PhotoDreamBaseSelect):
@@ -140,20 +186,25 @@ class PhotoDreamProfileSelect(PhotoDreamBaseSelect):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_profile"
+        super().__init__(hass, entry, device_id, device_config, device_info)
+        self._attr_unique_id = f"{unique_id_prefix}_profile"
+        self._last_written_state: tuple[str | None, tuple[str, ...]] | None = None
         self._update_options()
 
     def _update_options(self) -> None:
         """Update available profile options."""
-        profiles = get_all_profiles(self.hass)
-        self._profile_map = profiles  # {profile_id: display_name}
-        self._attr_options = list(profiles.values()) if profiles else ["No profiles configured"]
+        cache = _get_profiles_cache(self.hass)
+        self._profile_map = cache["profiles"]  # {profile_id: display_name}
+        self._profile_ids = cache["profile_ids"]  # {display_name: profile_id}
+        self._displays_by_name = cache["displays_by_name"]  # {profile_name: display_name}
+        self._attr_options = cache["options"]
 
     @property
-    def options(self) -> list[str]:
+    def options(self) -> tuple[str, ...]:
         """Return options, refreshing from current config entries."""
         self._update_options()
         return self._attr_options
@@ -165,44 +216,42 @@ class PhotoDreamProfileSelect(PhotoDreamBaseSelect):
         device_data = self._get_device_data()
         if device_data and device_data.get(ATTR_PROFILE):
             # Runtime data has profile name, try to find matching display name
-            profile_name = device_data.get(ATTR_PROFILE)
-            for pid, display in self._profile_map.items():
-                if profile_name in display:
-                    return display
+            display = self._displays_by_name.get(device_data.get(ATTR_PROFILE))
+            if display:
+                return display
         
         # Fall back to configured profile_id
         profile_id = self._get_device_config().get(CONF_PROFILE_ID, self._get_device_config().get("profile", ""))
         return self._profile_map.get(profile_id, self._attr_options[0] if self._attr_options else None)
 
+    @callback
+    def _handle_device_update(self, data: dict) -> None:
+        """Handle device update event, writing state only if it changed."""
+        # Options change when Immich profiles are added, renamed or removed
+        state = (self.current_option, self.options)
+        if state != self._last_written_state:
+            self._last_written_state = state
+            self.async_write_ha_state()
+
     async def async_select_option(self, option: str) -> None:
         """Change the selected profile."""
         # Refresh profile map first
         self._update_options()
         
         # Find profile_id from display name
-        profile_id = None
-        for pid, display in self._profile_map.items():
-            if display == option:
-                profile_id = pid
-                break
-        
+        profile_id = self._profile_ids.get(option)
         if not profile_id:
             _LOGGER.error("Could not find profile_id for option: %s (available: %s)", option, list(self._profile_map.keys()))
             return
         
-        _LOGGER.info("Setting profile to %s (%s) for device %s", option, profile_id, self._device_id)
-        
-        # Update config entry
-        self._update_device_config(CONF_PROFILE_ID, profile_id)
+        _LOGGER.debug("Setting profile to %s (%s) for device %s", option, profile_id, self._device_id)
         
-        # Small delay to ensure entry is updated before push
-        import asyncio
-        await asyncio.sleep(0.1)
-        
-        # Push to device
-        result = await push_config_to_device(self.hass, self._device_id)
-        _LOGGER.info("Config push result for %s: %s", self._device_id, result)
+        # Update config entry and push to device
+        if not self._update_device_config(CONF_PROFILE_ID, profile_id):
+            return  # Already set, nothing to write or push
+        schedule_push_config(self.hass, self._device_id)
         
+        self._last_written_state = (self.current_option, self.options)
         self.async_write_ha_state()
 
 
@@ -211,7 +260,7 @@ class PhotoDreamClockPositionSelect(PhotoDreamBaseSelect):
 
     _attr_name = "Clock Position"
     _attr_icon = "mdi:clock-outline"
-    _attr_options = list(CLOCK_POSITIONS.values())
+    _attr_options = tuple(CLOCK_POSITIONS.values())
 
     def __init__(
         self,
@@ -219,10 +268,12 @@ class PhotoDreamClockPositionSelect(PhotoDreamBaseSelect):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_clock_position"
+        super().__init__(hass, entry, device_id, device_config, device_info)
+        self._attr_unique_id = f"{unique_id_prefix}_clock_position"
 
     @property
     def current_option(self) -> str | None:
@@ -232,11 +283,11 @@ class PhotoDreamClockPositionSelect(PhotoDreamBaseSelect):
 
     async def async_select_option(self, option: str) -> None:
         """Change the clock position."""
-        pos_map = {v: k for k, v in CLOCK_POSITIONS.items()}
-        pos = pos_map.get(option, DEFAULT_CLOCK_POSITION)
+        pos = _POSITION_REVERSE_MAP.get(option, DEFAULT_CLOCK_POSITION)
         
-        self._update_device_config(CONF_CLOCK_POSITION, pos)
-        await push_config_to_device(self.hass, self._device_id)
+        if not self._update_device_config(CONF_CLOCK_POSITION, pos):
+            return  # Already set, nothing to write or push
+        schedule_push_config(self.hass, self._device_id)
         self.async_write_ha_state()
 
 
@@ -245,7 +296,7 @@ class PhotoDreamClockFormatSelect(PhotoDreamBaseSelect):
 
     _attr_name = "Clock Format"
     _attr_icon = "mdi:clock-digital"
-    _attr_options = ["12h", "24h"]
+    _attr_options = ("12h", "24h")
 
     def __init__(
         self,
@@ -253,10 +304,12 @@ class PhotoDreamClockFormatSelect(PhotoDreamBaseSelect):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_clock_format"
+        super().__init__(hass, entry, device_id, device_config, device_info)
+        self._attr_unique_id = f"{unique_id_prefix}_clock_format"
 
     @property
     def current_option(self) -> str | None:
@@ -265,8 +318,9 @@ class PhotoDreamClockFormatSelect(PhotoDreamBaseSelect):
 
     async def async_select_option(self, option: str) -> None:
         """Change the clock format."""
-        self._update_device_config(CONF_CLOCK_FORMAT, option)
-        await push_config_to_device(self.hass, self._device_id)
+        if not self._update_device_config(CONF_CLOCK_FORMAT, option):
+            return  # Already set, nothing to write or push
+        schedule_push_config(self.hass, self._device_id)
         self.async_write_ha_state()
 
 
@@ -275,7 +329,7 @@ class PhotoDreamDateFormatSelect(PhotoDreamBaseSelect):
 
     _attr_name = "Date Format"
     _attr_icon = "mdi:calendar"
-    _attr_options = list(DATE_FORMATS.keys())
+    _attr_options = tuple(DATE_FORMATS)
 
     def __init__(
         self,
@@ -283,10 +337,12 @@ class PhotoDreamDateFormatSelect(PhotoDreamBaseSelect):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_date_format"
+        super().__init__(hass, entry, device_id, device_config, device_info)
+        self._attr_unique_id = f"{unique_id_prefix}_date_format"
 
     @property
     def current_option(self) -> str | None:
@@ -295,8 +351,9 @@ class PhotoDreamDateFormatSelect(PhotoDreamBaseSelect):
 
     async def async_select_option(self, option: str) -> None:
         """Change the date format."""
-        self._update_device_config(CONF_DATE_FORMAT, option)
-        await push_config_to_device(self.hass, self._device_id)
+        if not self._update_device_config(CONF_DATE_FORMAT, option):
+            return  # Already set, nothing to write or push
+        schedule_push_config(self.hass, self._device_id)
         self.async_write_ha_state()
 
 
@@ -305,7 +362,7 @@ class PhotoDreamDisplayModeSelect(PhotoDreamBaseSelect):
 
     _attr_name = "Display Mode"
     _attr_icon = "mdi:shuffle-variant"
-    _attr_options = ["smart_shuffle", "random", "sequential"]
+    _attr_options = ("smart_shuffle", "random", "sequential")
 
     def __init__(
         self,
@@ -313,10 +370,12 @@ class PhotoDreamDisplayModeSelect(PhotoDreamBaseSelect):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_display_mode"
+        super().__init__(hass, entry, device_id, device_config, device_info)
+        self._attr_unique_id = f"{unique_id_prefix}_display_mode"
 
     @property
     def current_option(self) -> str | None:
@@ -325,8 +384,9 @@ class PhotoDreamDisplayModeSelect(PhotoDreamBaseSelect):
 
     async def async_select_option(self, option: str) -> None:
         """Change the display mode."""
-        self._update_device_config(CONF_DISPLAY_MODE, option)
-        await push_config_to_device(self.hass, self._device_id)
+        if not self._update_device_config(CONF_DISPLAY_MODE, option):
+            return  # Already set, nothing to write or push
+        schedule_push_config(self.hass, self._device_id)
         self.async_write_ha_state()
 
 
@@ -342,61 +402,57 @@ class PhotoDreamWeatherEntitySelect(PhotoDreamBaseSelect):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_weather_entity"
-        self._weather_map = {"None": None}
-        self._attr_options = ["None"]
+        super().__init__(hass, entry, device_id, device_config, device_info)
+        self._attr_unique_id = f"{unique_id_prefix}_weather_entity"
+        # Shared by all weather selects of the hub
+        self._weather: dict[str, Any] = hass.data[DOMAIN]["hub"]["weather"]
 
     async def async_added_to_hass(self) -> None:
-        """When entity is added to hass, update options."""
+        """When entity is added to hass, follow weather entity changes."""
         await super().async_added_to_hass()
-        self._update_options()
-
-    def _update_options(self) -> None:
-        """Update available weather entity options."""
-        self._weather_map = {"None": None}
-        
-        # Find all weather entities
-        for state in self.hass.states.async_all("weather"):
-            friendly_name = state.attributes.get("friendly_name", state.entity_id)
-            display = f"{friendly_name} ({state.entity_id})"
-            self._weather_map[display] = state.entity_id
-        
-        self._attr_options = list(self._weather_map.keys())
-        _LOGGER.debug("Weather entity options: %s", self._attr_options)
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_WEATHER_UPDATED, self.async_write_ha_state
+            )
+        )
 
     @property
-    def options(self) -> list[str]:
-        """Return options, refreshing if needed."""
-        if len(self._attr_options) <= 1:
-            self._update_options()
-        return self._attr_options
+    def options(self) -> tuple[str, ...]:
+        """Return options."""
+        return self._weather["options"]
 
     @property
     def current_option(self) -> str | None:
         """Return the current weather entity."""
-        self._update_options()  # Refresh options
         entity_id = self._get_device_config().get(CONF_WEATHER_ENTITY)
         if not entity_id:
             return "None"
         
-        # Find display name for entity_id
-        for display, eid in self._weather_map.items():
-            if eid == entity_id:
-                return display
-        
         # Entity not found in map, return entity_id directly
-        return entity_id
+        return self._weather["displays"].get(entity_id, entity_id)
 
     async def async_select_option(self, option: str) -> None:
         """Change the weather entity."""
-        self._update_options()  # Make sure map is fresh
-        entity_id = self._weather_map.get(option)
+        entity_id = self._weather["entity_map"].get(option)
         
-        _LOGGER.info("Setting weather entity to %s for device %s", entity_id, self._device_id)
+        _LOGGER.debug("Setting weather entity to %s for device %s", entity_id, self._device_id)
         
-        self._update_device_config(CONF_WEATHER_ENTITY, entity_id)
-        await push_config_to_device(self.hass, self._device_id)
+        if not self._update_device_config(CONF_WEATHER_ENTITY, entity_id):
+            return  # Already set, nothing to write or push
+        schedule_push_config(self.hass, self._device_id)
         self.async_write_ha_state()
+
+
+# Select entities created for every device
+SELECT_CLASSES = (
+    PhotoDreamProfileSelect,
+    PhotoDreamClockPositionSelect,
+    PhotoDreamClockFormatSelect,
+    PhotoDreamDateFormatSelect,
+    PhotoDreamDisplayModeSelect,
+    PhotoDreamWeatherEntitySelect,
+)
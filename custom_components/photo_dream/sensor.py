@@ -1,13 +1,17 @@
 """Sensor platform for PhotoDream."""
 from __future__ import annotations
 
+import json
 import logging
 from datetime import datetime
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -21,6 +25,9 @@ from .const import (
     CONF_IMMICH_NAME,
     CONF_SEARCH_FILTER,
     CONF_EXCLUDE_PATHS,
+    CONF_MEDIA_TYPE,
+    DEFAULT_MEDIA_TYPE,
+    MEDIA_TYPES,
     ATTR_CURRENT_IMAGE,
     ATTR_CURRENT_IMAGE_URL,
     ATTR_PROFILE,
@@ -30,8 +37,10 @@ from .const import (
     ATTR_DISPLAY_WIDTH,
     ATTR_DISPLAY_HEIGHT,
     ATTR_APP_VERSION,
+    SIGNAL_DEVICE_UPDATE,
 )
 from .helpers import get_device_info
+from . import parse_immich_url, resolve_profile
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,23 +65,74 @@ async def async_setup_hub_sensors(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up tablet sensors for Hub entry."""
-    devices = entry.data.get(CONF_DEVICES, {})
+    devices = entry.data[CONF_DEVICES]
+    if not devices:
+        return
     
     entities = []
     for device_id, device_config in devices.items():
-        entities.append(PhotoDreamCurrentImageSensor(hass, entry, device_id, device_config))
-        entities.append(PhotoDreamMacAddressSensor(hass, entry, device_id, device_config))
-        entities.append(PhotoDreamIpAddressSensor(hass, entry, device_id, device_config))
-        entities.append(PhotoDreamResolutionSensor(hass, entry, device_id, device_config))
-        entities.append(PhotoDreamVersionSensor(hass, entry, device_id, device_config))
+        # Shared by all sensors of this device
+        unique_id_prefix = f"{entry.entry_id}_{device_id}"
+        device_info = get_device_info(hass, entry, device_id, device_config)
+        entities.extend(
+            entity_class(
+                hass, entry, device_id, device_config, unique_id_prefix, device_info
+            )
+            for entity_class in HUB_SENSOR_CLASSES
+        )
+        entities.extend(
+            PhotoDreamStatusSensor(
+                hass, entry, device_id, device_config, unique_id_prefix, device_info,
+                *status_sensor,
+            )
+            for status_sensor in HUB_STATUS_SENSORS
+        )
     
     async_add_entities(entities)
+    
+    # One subscription per device; its sensors join the set once added
+    sensor_listeners = hass.data[DOMAIN]["hub"]["sensor_listeners"]
+    for device_id in devices:
+        sensors = sensor_listeners.setdefault(device_id, set())
+        entry.async_on_unload(
+            async_dispatcher_connect(
+                hass,
+                SIGNAL_DEVICE_UPDATE.format(device_id),
+                _device_update_dispatcher(sensors),
+            )
+        )
+
+
+def _device_update_dispatcher(
+    sensors: set[PhotoDreamBaseSensor],
+) -> Callable[[dict], None]:
+    """Return a device update handler that notifies the given sensors."""
+
+    @callback
+    def _async_device_updated(data: dict) -> None:
+        for sensor in sensors:
+            sensor.async_handle_device_update(data)
+
+    return _async_device_updated
 
 
 class PhotoDreamBaseSensor(SensorEntity):
     """Base class for PhotoDream sensors."""
 
     _attr_has_entity_name = True
+    # Pushed by the status webhook, like a coordinator entity
+    _attr_should_poll = False
+
+    # Only our own attributes; hass and _attr_* stay with the Entity base,
+    # which keeps an instance __dict__
+    __slots__ = (
+        "_entry",
+        "_device_id",
+        "_device_config",
+        "_devices",
+        "_device_data",
+        "_last_rendered",
+    )
 
     def __init__(
         self,
@@ -80,34 +140,52 @@ class PhotoDreamBaseSensor(SensorEntity):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         self.hass = hass
         self._entry = entry
         self._device_id = device_id
         self._device_config = device_config
-        self._attr_device_info = get_device_info(hass, entry, device_id, device_config)
+        self._attr_device_info = device_info
+        # Hub status dicts by device, bound when added to hass
+        self._devices: dict[str, dict] = {}
+        # Resolved status dict, reused until the next device update
+        self._device_data: dict | None = None
+        # State and attributes as last written
+        self._last_rendered: tuple | None = None
 
     def _get_device_data(self) -> dict | None:
         """Get device data from hass.data."""
-        hub_data = self.hass.data.get(DOMAIN, {}).get("hub")
-        if not hub_data:
-            return None
-        return hub_data.get("devices", {}).get(self._device_id)
+        if self._device_data is None:
+            self._device_data = self._devices.get(self._device_id)
+        return self._device_data
+
+    @property
+    def available(self) -> bool:
+        """Return True once the tablet has reported its status."""
+        return self._get_device_data() is not None
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
-        self.async_on_remove(
-            self.hass.bus.async_listen(
-                f"{DOMAIN}_device_update",
-                self._handle_device_update,
-            )
+        # The hub keeps one devices dict for its lifetime
+        self._devices = self.hass.data[DOMAIN]["hub"]["devices"]
+        self._device_data = None
+        # Updates are dispatched per device by async_setup_hub_sensors
+        sensors = self.hass.data[DOMAIN]["hub"]["sensor_listeners"].setdefault(
+            self._device_id, set()
         )
+        sensors.add(self)
+        self.async_on_remove(lambda: sensors.discard(self))
 
     @callback
-    def _handle_device_update(self, event) -> None:
-        """Handle device update event."""
-        if event.data.get("device_id") == self._device_id:
+    def async_handle_device_update(self, data: dict) -> None:
+        """Handle device update event, writing state only if it changed."""
+        # The webhook stores a new status dict on every update
+        self._device_data = None
+        rendered = (self.native_value, self.extra_state_attributes)
+        if rendered != self._last_rendered:
+            self._last_rendered = rendered
             self.async_write_ha_state()
 
 
@@ -117,91 +195,77 @@ class PhotoDreamCurrentImageSensor(PhotoDreamBaseSensor):
     _attr_name = "Current Image"
     _attr_icon = "mdi:image"
 
+    __slots__ = ("_attributes", "_attributes_source")
+
     def __init__(
         self,
         hass: HomeAssistant,
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_current_image"
+        super().__init__(hass, entry, device_id, device_config, device_info)
+        self._attr_unique_id = f"{unique_id_prefix}_current_image"
+        # Attributes and the status dict they were built from
+        self._attributes: dict[str, Any] = {}
+        self._attributes_source: dict | None = None
 
     @property
     def native_value(self) -> str | None:
         """Return the Immich web URL for the current image."""
-        device_data = self._get_device_data()
-        if not device_data:
-            return None
-        
-        image_id = device_data.get(ATTR_CURRENT_IMAGE)
+        image_id = self._get_device_data().get(ATTR_CURRENT_IMAGE)
         if not image_id:
             return None
         
-        # Get Immich URL by resolving the profile
-        immich_url = self._get_immich_url()
+        # Get Immich photo URL prefix by resolving the profile
+        photo_url_prefix = self._get_photo_url_prefix()
         
-        if immich_url:
-            return f"{immich_url}/photos/{image_id}"
+        if photo_url_prefix:
+            return photo_url_prefix + image_id
         return image_id
 
-    def _get_immich_url(self) -> str | None:
-        """Get Immich URL from the device's profile."""
-        from . import resolve_profile
-        
-        profile_id = self._device_config.get(CONF_PROFILE_ID, self._device_config.get("profile", ""))
-        immich_entry, _, _ = resolve_profile(self.hass, profile_id)
+    def _get_photo_url_prefix(self) -> str | None:
+        """Get the Immich photo URL prefix from the device's profile."""
+        device = self._entry.data.get(CONF_DEVICES, {}).get(self._device_id, self._device_config)
+        profile_id = device.get(CONF_PROFILE_ID, device.get("profile", ""))
         
-        if immich_entry:
-            from .const import CONF_IMMICH_URL
-            return immich_entry.data.get(CONF_IMMICH_URL, "").rstrip("/")
-        return None
+        # Shared by all sensors until an Immich entry changes
+        prefixes = self.hass.data[DOMAIN].setdefault("photo_url_prefixes", {})
+        if profile_id not in prefixes:
+            immich_entry, _, _ = resolve_profile(self.hass, profile_id)
+            immich_data = (
+                self.hass.data[DOMAIN]["immich"].get(immich_entry.entry_id)
+                if immich_entry
+                else None
+            )
+            immich_url = immich_data["url"] if immich_data else None
+            prefixes[profile_id] = f"{immich_url}/photos/" if immich_url else None
+        return prefixes[profile_id]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         device_data = self._get_device_data()
-        if not device_data:
-            return {}
-        
-        return {
-            "image_id": device_data.get(ATTR_CURRENT_IMAGE),
-            "api_url": device_data.get(ATTR_CURRENT_IMAGE_URL),
-            ATTR_PROFILE: device_data.get(ATTR_PROFILE),
-            ATTR_LAST_SEEN: device_data.get(ATTR_LAST_SEEN),
-        }
-
-
-class PhotoDreamMacAddressSensor(PhotoDreamBaseSensor):
-    """Sensor showing MAC address of a PhotoDream device."""
-
-    _attr_name = "MAC Address"
-    _attr_icon = "mdi:ethernet"
-
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
-        device_id: str,
-        device_config: dict,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_mac_address"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the MAC address."""
-        device_data = self._get_device_data()
-        return device_data.get(ATTR_MAC_ADDRESS) if device_data else None
+        # The webhook stores a new status dict on every update, so the dict
+        # itself tells whether the attributes need rebuilding
+        if device_data is not self._attributes_source:
+            self._attributes_source = device_data
+            self._attributes = {
+                "image_id": device_data.get(ATTR_CURRENT_IMAGE),
+                "api_url": device_data.get(ATTR_CURRENT_IMAGE_URL),
+                ATTR_PROFILE: device_data.get(ATTR_PROFILE),
+                ATTR_LAST_SEEN: device_data.get(ATTR_LAST_SEEN),
+            }
+        return self._attributes
 
 
-class PhotoDreamIpAddressSensor(PhotoDreamBaseSensor):
-    """Sensor showing IP address of a PhotoDream device."""
+class PhotoDreamStatusSensor(PhotoDreamBaseSensor):
+    """Sensor showing one value from a PhotoDream device's status report."""
 
-    _attr_name = "IP Address"
-    _attr_icon = "mdi:ip-network"
+    __slots__ = ("_status_key",)
 
     def __init__(
         self,
@@ -209,16 +273,24 @@ class PhotoDreamIpAddressSensor(PhotoDreamBaseSensor):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
+        status_key: str,
+        name: str,
+        icon: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_ip_address"
+        super().__init__(hass, entry, device_id, device_config, device_info)
+        self._status_key = status_key
+        self._attr_name = name
+        self._attr_icon = icon
+        # The status key doubles as the unique_id suffix
+        self._attr_unique_id = f"{unique_id_prefix}_{status_key}"
 
     @property
     def native_value(self) -> str | None:
-        """Return the IP address."""
-        device_data = self._get_device_data()
-        return device_data.get(ATTR_IP_ADDRESS) if device_data else None
+        """Return the reported value."""
+        return self._get_device_data().get(self._status_key)
 
 
 class PhotoDreamResolutionSensor(PhotoDreamBaseSensor):
@@ -233,17 +305,17 @@ class PhotoDreamResolutionSensor(PhotoDreamBaseSensor):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_resolution"
+        super().__init__(hass, entry, device_id, device_config, device_info)
+        self._attr_unique_id = f"{unique_id_prefix}_resolution"
 
     @property
     def native_value(self) -> str | None:
         """Return the resolution as WxH."""
         device_data = self._get_device_data()
-        if not device_data:
-            return None
         width = device_data.get(ATTR_DISPLAY_WIDTH)
         height = device_data.get(ATTR_DISPLAY_HEIGHT)
         if width and height:
@@ -251,28 +323,18 @@ class PhotoDreamResolutionSensor(PhotoDreamBaseSensor):
         return None
 
 
-class PhotoDreamVersionSensor(PhotoDreamBaseSensor):
-    """Sensor showing app version of a PhotoDream device."""
-
-    _attr_name = "App Version"
-    _attr_icon = "mdi:tag"
-
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
-        device_id: str,
-        device_config: dict,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_app_version"
+# Tablet sensors created for every device
+HUB_SENSOR_CLASSES = (
+    PhotoDreamCurrentImageSensor,
+    PhotoDreamResolutionSensor,
+)
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the app version."""
-        device_data = self._get_device_data()
-        return device_data.get(ATTR_APP_VERSION) if device_data else None
+# Status values shown as-is: (status key, name, icon)
+HUB_STATUS_SENSORS = (
+    (ATTR_MAC_ADDRESS, "MAC Address", "mdi:ethernet"),
+    (ATTR_IP_ADDRESS, "IP Address", "mdi:ip-network"),
+    (ATTR_APP_VERSION, "App Version", "mdi:tag"),
+)
 
 
 # ============================================================================
@@ -301,11 +363,18 @@ async def async_setup_immich_sensors(
     entities = []
     for profile_name, profile_config in profiles.items():
         profile_id = f"{entry.entry_id}_{profile_name}".replace(" ", "_").lower()
-        entities.append(ProfileImageCountSensor(coordinator, entry, profile_name, profile_id))
-        entities.append(ProfileLastRefreshSensor(coordinator, entry, profile_name, profile_id))
-        entities.append(ProfileSearchFilterSensor(coordinator, entry, profile_name, profile_id, profile_config))
-        entities.append(ProfileExcludePathsSensor(coordinator, entry, profile_name, profile_id, profile_config))
-        entities.append(ProfileMediaTypeSensor(coordinator, entry, profile_name, profile_id, profile_config))
+        # Shared by all sensors of this profile
+        unique_id_prefix = f"profile_{profile_id}"
+        device_info = DeviceInfo(identifiers={(DOMAIN, unique_id_prefix)})
+        args = (entry, profile_name, profile_id, unique_id_prefix, device_info)
+        entities.extend(
+            entity_class(coordinator, *args)
+            for entity_class in PROFILE_STATUS_SENSOR_CLASSES
+        )
+        entities.extend(
+            entity_class(*args, profile_config)
+            for entity_class in PROFILE_CONFIG_SENSOR_CLASSES
+        )
     
     async_add_entities(entities)
 
@@ -317,22 +386,24 @@ class ProfileImageCountSensor(CoordinatorEntity, SensorEntity):
     _attr_name = "Image Count"
     _attr_icon = "mdi:image-multiple"
 
+    __slots__ = ("_entry", "_profile_name", "_profile_id")
+
     def __init__(
         self,
         coordinator,
         entry: ConfigEntry,
         profile_name: str,
         profile_id: str,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._entry = entry
         self._profile_name = profile_name
         self._profile_id = profile_id
-        self._attr_unique_id = f"profile_{profile_id}_image_count"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"profile_{profile_id}")},
-        }
+        self._attr_unique_id = f"{unique_id_prefix}_image_count"
+        self._attr_device_info = device_info
 
     @property
     def native_value(self) -> int | None:
@@ -350,22 +421,24 @@ class ProfileLastRefreshSensor(CoordinatorEntity, SensorEntity):
     _attr_icon = "mdi:clock-outline"
     _attr_device_class = "timestamp"
 
+    __slots__ = ("_entry", "_profile_name", "_profile_id")
+
     def __init__(
         self,
         coordinator,
         entry: ConfigEntry,
         profile_name: str,
         profile_id: str,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._entry = entry
         self._profile_name = profile_name
         self._profile_id = profile_id
-        self._attr_unique_id = f"profile_{profile_id}_last_refresh"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"profile_{profile_id}")},
-        }
+        self._attr_unique_id = f"{unique_id_prefix}_last_refresh"
+        self._attr_device_info = device_info
 
     @property
     def native_value(self) -> datetime | None:
@@ -375,36 +448,52 @@ class ProfileLastRefreshSensor(CoordinatorEntity, SensorEntity):
         return None
 
 
-class ProfileSearchFilterSensor(CoordinatorEntity, SensorEntity):
+class ProfileSearchFilterSensor(SensorEntity):
     """Sensor showing the search filter/URL for a profile."""
 
     _attr_has_entity_name = True
+    # Shows config only; nothing to poll or subscribe to
+    _attr_should_poll = False
     _attr_name = "Search Filter"
     _attr_icon = "mdi:filter"
 
+    __slots__ = (
+        "_entry",
+        "_profile_name",
+        "_profile_id",
+        "_profile_config",
+        "_filter_value",
+        "_filter_attributes",
+    )
+
     def __init__(
         self,
-        coordinator,
         entry: ConfigEntry,
         profile_name: str,
         profile_id: str,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
         profile_config: dict,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
         self._entry = entry
         self._profile_name = profile_name
         self._profile_id = profile_id
         self._profile_config = profile_config
-        self._attr_unique_id = f"profile_{profile_id}_search_filter"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"profile_{profile_id}")},
+        self._attr_unique_id = f"{unique_id_prefix}_search_filter"
+        self._attr_device_info = device_info
+        # The profile config is fixed for the entity's lifetime (changes reload
+        # the entry), so render the value and attributes once
+        raw_filter = profile_config.get(CONF_SEARCH_FILTER)
+        self._filter_value = self._render_filter(raw_filter)
+        self._filter_attributes = {
+            "raw_input": raw_filter if isinstance(raw_filter, str) else None,
+            "parsed_filter": parse_immich_url(raw_filter or {}),
         }
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the search filter as string/URL."""
-        raw_filter = self._profile_config.get(CONF_SEARCH_FILTER)
+    @staticmethod
+    def _render_filter(raw_filter: Any) -> str | None:
+        """Render the search filter as string/URL."""
         if not raw_filter:
             return None
         
@@ -414,107 +503,111 @@ class ProfileSearchFilterSensor(CoordinatorEntity, SensorEntity):
         
         # If it's a dict, convert to readable string
         if isinstance(raw_filter, dict):
-            import json
             return json.dumps(raw_filter, ensure_ascii=False)
         
         return str(raw_filter)
 
+    @property
+    def native_value(self) -> str | None:
+        """Return the search filter as string/URL."""
+        return self._filter_value
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the parsed filter as attributes."""
-        from . import parse_immich_url
-        
-        raw_filter = self._profile_config.get(CONF_SEARCH_FILTER, {})
-        parsed = parse_immich_url(raw_filter)
-        
-        return {
-            "raw_input": raw_filter if isinstance(raw_filter, str) else None,
-            "parsed_filter": parsed,
-        }
+        return self._filter_attributes
 
 
-class ProfileExcludePathsSensor(CoordinatorEntity, SensorEntity):
+class ProfileExcludePathsSensor(SensorEntity):
     """Sensor showing the exclude paths for a profile."""
 
     _attr_has_entity_name = True
+    # Shows config only; nothing to poll or subscribe to
+    _attr_should_poll = False
     _attr_name = "Exclude Paths"
     _attr_icon = "mdi:folder-remove"
 
+    __slots__ = ("_entry", "_profile_name", "_profile_id", "_profile_config")
+
     def __init__(
         self,
-        coordinator,
         entry: ConfigEntry,
         profile_name: str,
         profile_id: str,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
         profile_config: dict,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
         self._entry = entry
         self._profile_name = profile_name
         self._profile_id = profile_id
         self._profile_config = profile_config
-        self._attr_unique_id = f"profile_{profile_id}_exclude_paths"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"profile_{profile_id}")},
-        }
-
-    @property
-    def native_value(self) -> int:
-        """Return the number of exclude paths."""
-        exclude_paths = self._profile_config.get(CONF_EXCLUDE_PATHS, [])
-        return len(exclude_paths)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the exclude paths as attributes."""
-        exclude_paths = self._profile_config.get(CONF_EXCLUDE_PATHS, [])
-        return {
+        self._attr_unique_id = f"{unique_id_prefix}_exclude_paths"
+        self._attr_device_info = device_info
+        # Fixed for the entity's lifetime, like the search filter
+        exclude_paths = tuple(profile_config.get(CONF_EXCLUDE_PATHS, []))
+        self._attr_native_value = len(exclude_paths)
+        self._attr_extra_state_attributes = MappingProxyType({
             "paths": exclude_paths,
-            "patterns": [p.replace("*", "") for p in exclude_paths],
-        }
+            "patterns": tuple(p.replace("*", "") for p in exclude_paths),
+        })
 
 
-class ProfileMediaTypeSensor(CoordinatorEntity, SensorEntity):
+class ProfileMediaTypeSensor(SensorEntity):
     """Sensor showing the media type filter for a profile."""
 
     _attr_has_entity_name = True
+    # Shows config only; nothing to poll or subscribe to
+    _attr_should_poll = False
     _attr_name = "Media Type"
     _attr_icon = "mdi:file-image"
 
+    __slots__ = ("_entry", "_profile_name", "_profile_id", "_profile_config")
+
     def __init__(
         self,
-        coordinator,
         entry: ConfigEntry,
         profile_name: str,
         profile_id: str,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
         profile_config: dict,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
         self._entry = entry
         self._profile_name = profile_name
         self._profile_id = profile_id
         self._profile_config = profile_config
-        self._attr_unique_id = f"profile_{profile_id}_media_type"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"profile_{profile_id}")},
-        }
+        self._attr_unique_id = f"{unique_id_prefix}_media_type"
+        self._attr_device_info = device_info
 
     @property
     def native_value(self) -> str:
         """Return the media type."""
-        from .const import DEFAULT_MEDIA_TYPE, MEDIA_TYPES, CONF_MEDIA_TYPE
         media_type = self._profile_config.get(CONF_MEDIA_TYPE, DEFAULT_MEDIA_TYPE)
         return MEDIA_TYPES.get(media_type, media_type)
 
     @property
     def icon(self) -> str:
         """Return icon based on media type."""
-        from .const import CONF_MEDIA_TYPE, DEFAULT_MEDIA_TYPE
         media_type = self._profile_config.get(CONF_MEDIA_TYPE, DEFAULT_MEDIA_TYPE)
         if media_type == "video":
             return "mdi:video"
         elif media_type == "both":
             return "mdi:file-image"
         return "mdi:image"
+
+
+# Profile sensors reporting coordinator results
+PROFILE_STATUS_SENSOR_CLASSES = (
+    ProfileImageCountSensor,
+    ProfileLastRefreshSensor,
+)
+
+# Profile sensors showing the profile's configuration
+PROFILE_CONFIG_SENSOR_CLASSES = (
+    ProfileSearchFilterSensor,
+    ProfileExcludePathsSensor,
+    ProfileMediaTypeSensor,
+)
@@ -2,27 +2,38 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 from typing import Any, Callable
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .helpers import get_device_info
+from .helpers import PhotoDreamDeviceEntity, get_device_info
 
 from .const import (
-    DOMAIN,
+    EVENT_BRIGHTNESS_CHANGED,
     ENTRY_TYPE_HUB,
     CONF_DEVICES,
     CONF_CLOCK,
     CONF_DATE,
     CONF_WEATHER,
+    DEFAULT_CLOCK,
+    DEFAULT_DATE,
+    DEFAULT_WEATHER,
 )
-from . import push_config_to_device, get_device_data, send_command_to_device
+from . import schedule_push_config, send_command_to_device
+from .coordinator import PhotoDreamBrightnessCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Quiet period after brightness changes before auto-brightness is re-read
+BRIGHTNESS_REFRESH_DELAY = 0.05
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -34,127 +45,51 @@ async def async_setup_entry(
     if entry.data.get("entry_type") != ENTRY_TYPE_HUB:
         return
     
-    devices = entry.data.get(CONF_DEVICES, {})
+    devices = entry.data[CONF_DEVICES]
+    if not devices:
+        return
+    
+    # One poll for the auto-brightness state of all tablets; the first one
+    # runs in the background so offline tablets don't hold up setup
+    brightness_coordinator = PhotoDreamBrightnessCoordinator(hass, entry)
+    entry.async_create_background_task(
+        hass,
+        brightness_coordinator.async_refresh(),
+        "photo_dream auto brightness first refresh",
+    )
     
     entities = []
     for device_id, device_config in devices.items():
-        entities.append(PhotoDreamClockSwitch(hass, entry, device_id, device_config))
-        entities.append(PhotoDreamDateSwitch(hass, entry, device_id, device_config))
-        entities.append(PhotoDreamWeatherSwitch(hass, entry, device_id, device_config))
-        entities.append(PhotoDreamAutoBrightnessSwitch(hass, entry, device_id, device_config))
+        # Shared by all switches of this device
+        unique_id_prefix = f"{entry.entry_id}_{device_id}"
+        device_info = get_device_info(hass, entry, device_id, device_config)
+        entities.extend(
+            PhotoDreamConfigSwitch(
+                hass, entry, device_id, device_config, unique_id_prefix, device_info,
+                *config_switch,
+            )
+            for config_switch in CONFIG_SWITCHES
+        )
+        entities.append(
+            PhotoDreamAutoBrightnessSwitch(
+                brightness_coordinator,
+                hass, entry, device_id, device_config, unique_id_prefix, device_info,
+            )
+        )
     
     async_add_entities(entities)
 
 
-class PhotoDreamBaseSwitch(SwitchEntity):
+class PhotoDreamBaseSwitch(PhotoDreamDeviceEntity, SwitchEntity):
     """Base class for PhotoDream switches."""
 
     _attr_has_entity_name = True
 
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
-        device_id: str,
-        device_config: dict,
-    ) -> None:
-        """Initialize the switch."""
-        self.hass = hass
-        self._entry = entry
-        self._device_id = device_id
-        self._device_config = device_config
-        self._attr_device_info = get_device_info(hass, entry, device_id, device_config)
-
-    def _get_device_config(self) -> dict:
-        """Get current device config."""
-        return self._entry.data.get(CONF_DEVICES, {}).get(self._device_id, {})
-
-    def _update_device_config(self, key: str, value: Any) -> None:
-        """Update device config in entry data."""
-        new_data = dict(self._entry.data)
-        if CONF_DEVICES not in new_data:
-            new_data[CONF_DEVICES] = {}
-        if self._device_id not in new_data[CONF_DEVICES]:
-            new_data[CONF_DEVICES][self._device_id] = dict(self._device_config)
-        new_data[CONF_DEVICES][self._device_id][key] = value
-        self.hass.config_entries.async_update_entry(self._entry, data=new_data)
-
-
-class PhotoDreamClockSwitch(PhotoDreamBaseSwitch):
-    """Switch to toggle clock display on a PhotoDream device."""
-
-    _attr_name = "Clock"
-    _attr_icon = "mdi:clock-outline"
-
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
-        device_id: str,
-        device_config: dict,
-    ) -> None:
-        """Initialize the switch."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_clock"
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if clock is enabled."""
-        return self._get_device_config().get(CONF_CLOCK, True)
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on the clock."""
-        self._update_device_config(CONF_CLOCK, True)
-        await push_config_to_device(self.hass, self._device_id)
-        self.async_write_ha_state()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn off the clock."""
-        self._update_device_config(CONF_CLOCK, False)
-        await push_config_to_device(self.hass, self._device_id)
-        self.async_write_ha_state()
-
-
-class PhotoDreamDateSwitch(PhotoDreamBaseSwitch):
-    """Switch to toggle date display on a PhotoDream device."""
-
-    _attr_name = "Date"
-    _attr_icon = "mdi:calendar"
-
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        entry: ConfigEntry,
-        device_id: str,
-        device_config: dict,
-    ) -> None:
-        """Initialize the switch."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_date"
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if date is enabled."""
-        return self._get_device_config().get(CONF_DATE, False)
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on the date."""
-        self._update_device_config(CONF_DATE, True)
-        await push_config_to_device(self.hass, self._device_id)
-        self.async_write_ha_state()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn off the date."""
-        self._update_device_config(CONF_DATE, False)
-        await push_config_to_device(self.hass, self._device_id)
-        self.async_write_ha_state()
 
+class PhotoDreamConfigSwitch(PhotoDreamBaseSwitch):
+    """Switch toggling one display option of a PhotoDream device."""
 
-class PhotoDreamWeatherSwitch(PhotoDreamBaseSwitch):
-    """Switch to toggle weather display on a PhotoDream device."""
-
-    _attr_name = "Weather"
-    _attr_icon = "mdi:weather-partly-cloudy"
+    __slots__ = ("_config_key", "_default")
 
     def __init__(
         self,
@@ -162,73 +97,136 @@ class PhotoDreamWeatherSwitch(PhotoDreamBaseSwitch):
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
+        config_key: str,
+        name: str,
+        icon: str,
+        default: bool,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(hass, entry, device_id, device_config)
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_weather"
+        super().__init__(hass, entry, device_id, device_config, device_info)
+        self._config_key = config_key
+        self._default = default
+        self._attr_name = name
+        self._attr_icon = icon
+        # The config key doubles as the unique_id suffix
+        self._attr_unique_id = f"{unique_id_prefix}_{config_key}"
 
     @property
     def is_on(self) -> bool:
-        """Return true if weather is enabled."""
-        return self._get_device_config().get(CONF_WEATHER, False)
+        """Return true if the option is enabled."""
+        return self._get_device_config().get(self._config_key, self._default)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on the weather."""
-        self._update_device_config(CONF_WEATHER, True)
-        await push_config_to_device(self.hass, self._device_id)
-        self.async_write_ha_state()
+        """Turn on the option."""
+        await self._async_set(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn off the weather."""
-        self._update_device_config(CONF_WEATHER, False)
-        await push_config_to_device(self.hass, self._device_id)
+        """Turn off the option."""
+        await self._async_set(False)
+
+    async def _async_set(self, enabled: bool) -> None:
+        """Store the option and push it to the device if it changed."""
+        if self.is_on == enabled:
+            return
+        self._update_device_config(self._config_key, enabled)
+        schedule_push_config(self.hass, self._device_id)
         self.async_write_ha_state()
 
 
-class PhotoDreamAutoBrightnessSwitch(SwitchEntity):
+class PhotoDreamAutoBrightnessSwitch(
+    CoordinatorEntity[PhotoDreamBrightnessCoordinator], SwitchEntity
+):
     """Switch to toggle auto-brightness on a PhotoDream device."""
 
     _attr_has_entity_name = True
     _attr_name = "Auto Brightness"
     _attr_icon = "mdi:brightness-auto"
 
+    __slots__ = (
+        "_entry",
+        "_device_id",
+        "_is_on",
+        "_supported",
+        "_remove_listener",
+        "_unsub_refresh",
+    )
+
     def __init__(
         self,
+        coordinator: PhotoDreamBrightnessCoordinator,
         hass: HomeAssistant,
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the switch."""
+        super().__init__(coordinator)
         self.hass = hass
         self._entry = entry
         self._device_id = device_id
-        self._device_config = device_config
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_auto_brightness"
-        self._attr_device_info = get_device_info(hass, entry, device_id, device_config)
+        self._attr_unique_id = f"{unique_id_prefix}_auto_brightness"
+        self._attr_device_info = device_info
         self._is_on: bool = False  # Default until first poll
         self._supported: bool = True
         self._remove_listener: Any = None
+        self._unsub_refresh: CALLBACK_TYPE | None = None
     
     async def async_added_to_hass(self) -> None:
         """Register event listener when added to hass."""
-        from .const import DOMAIN
+        await super().async_added_to_hass()
+        self._update_from_coordinator()
         
-        async def handle_brightness_changed(event):
-            """Handle brightness change event - refresh our state."""
-            if event.data.get("device_id") == self._device_id:
-                await self.async_update()
-                self.async_write_ha_state()
+        @callback
+        def handle_brightness_changed(event):
+            """Handle brightness change event - schedule a state refresh."""
+            if event.data.get("device_id") != self._device_id:
+                return
+            # A burst of brightness changes results in a single refresh
+            if self._unsub_refresh is not None:
+                self._unsub_refresh()
+            self._unsub_refresh = async_call_later(
+                self.hass, BRIGHTNESS_REFRESH_DELAY, self._async_refresh_state
+            )
         
         self._remove_listener = self.hass.bus.async_listen(
-            f"{DOMAIN}_brightness_changed",
+            EVENT_BRIGHTNESS_CHANGED,
             handle_brightness_changed
         )
     
     async def async_will_remove_from_hass(self) -> None:
         """Remove event listener when removed from hass."""
+        await super().async_will_remove_from_hass()
         if self._remove_listener:
             self._remove_listener()
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+    async def _async_refresh_state(self, _now: datetime) -> None:
+        """Refresh the state after brightness changes settled."""
+        self._unsub_refresh = None
+        # Only this tablet changed, the others keep their polled state
+        await self.coordinator.async_refresh_device(self._device_id)
+
+    def _update_from_coordinator(self) -> bool:
+        """Take this tablet's state from the coordinator, return True if changed."""
+        data = (self.coordinator.data or {}).get(self._device_id)
+        if not data:
+            return False
+        previous = (self._is_on, self._supported)
+        self._is_on = data.get("auto_brightness", False)
+        self._supported = data.get("supported", True)
+        return (self._is_on, self._supported) != previous
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if this tablet's auto-brightness changed."""
+        if self._update_from_coordinator():
+            self.async_write_ha_state()
 
     @property
     def is_on(self) -> bool:
@@ -238,14 +236,7 @@ class PhotoDreamAutoBrightnessSwitch(SwitchEntity):
     @property
     def available(self) -> bool:
         """Return true if auto-brightness is supported by device."""
-        return self._supported
-
-    async def async_update(self) -> None:
-        """Fetch latest auto-brightness state from device."""
-        data = await get_device_data(self.hass, self._device_id, "auto-brightness")
-        if data:
-            self._is_on = data.get("auto_brightness", False)
-            self._supported = data.get("supported", True)
+        return super().available and self._supported
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on auto-brightness."""
@@ -264,3 +255,11 @@ class PhotoDreamAutoBrightnessSwitch(SwitchEntity):
         if success:
             self._is_on = False
             self.async_write_ha_state()
+
+
+# Display options shown as switches: (config key, name, icon, default)
+CONFIG_SWITCHES = (
+    (CONF_CLOCK, "Clock", "mdi:clock-outline", DEFAULT_CLOCK),
+    (CONF_DATE, "Date", "mdi:calendar", DEFAULT_DATE),
+    (CONF_WEATHER, "Weather", "mdi:weather-partly-cloudy", DEFAULT_WEATHER),
+)
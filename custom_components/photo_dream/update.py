@@ -1,7 +1,9 @@
 """Update platform for PhotoDream."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from datetime import timedelta
 from typing import Any
 
@@ -14,8 +16,11 @@ from homeassistant.components.update import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
 from .const import (
     DOMAIN,
@@ -26,6 +31,7 @@ from .const import (
     DEFAULT_PORT,
     ATTR_APP_VERSION,
     GITHUB_API_RELEASES,
+    SIGNAL_DEVICE_UPDATE,
 )
 from .helpers import get_device_info
 
@@ -33,6 +39,13 @@ _LOGGER = logging.getLogger(__name__)
 
 # Cache release info for 1 hour
 SCAN_INTERVAL = timedelta(hours=1)
+RELEASE_CACHE_TTL = SCAN_INTERVAL.total_seconds()
+# Wait this long before asking GitHub again after a failed lookup
+RELEASE_RETRY_INTERVAL = 300
+
+RELEASE_TIMEOUT = aiohttp.ClientTimeout(total=30)
+# APK download on the tablet might take a while
+INSTALL_TIMEOUT = aiohttp.ClientTimeout(total=60)
 
 
 async def async_setup_entry(
@@ -46,15 +59,101 @@ async def async_setup_entry(
     if entry_type != ENTRY_TYPE_HUB:
         return
     
-    devices = entry.data.get(CONF_DEVICES, {})
-    
-    entities = []
-    for device_id, device_config in devices.items():
-        entities.append(PhotoDreamUpdateEntity(hass, entry, device_id, device_config))
+    devices = entry.data[CONF_DEVICES]
+    if not devices:
+        return
     
+    entities = [
+        PhotoDreamUpdateEntity(
+            hass,
+            entry,
+            device_id,
+            device_config,
+            f"{entry.entry_id}_{device_id}",
+            get_device_info(hass, entry, device_id, device_config),
+        )
+        for device_id, device_config in devices.items()
+    ]
     async_add_entities(entities)
 
 
+async def _async_get_latest_release(hass: HomeAssistant) -> dict[str, Any] | None:
+    """Return the latest release info, shared by all tablets.
+    
+    GitHub is asked at most once per RELEASE_CACHE_TTL, or once per
+    RELEASE_RETRY_INTERVAL after a failure; concurrent callers wait for the
+    same request and then get its result.
+    """
+    cache = hass.data[DOMAIN].setdefault(
+        "release_cache",
+        {"lock": asyncio.Lock(), "next_fetch": 0.0, "release": None, "etag": None},
+    )
+    async with cache["lock"]:
+        if time.monotonic() >= cache["next_fetch"]:
+            release = await _async_fetch_latest_release(hass, cache)
+            if release is not None:
+                cache["release"] = release
+                cache["next_fetch"] = time.monotonic() + RELEASE_CACHE_TTL
+            else:
+                cache["next_fetch"] = time.monotonic() + RELEASE_RETRY_INTERVAL
+        return cache["release"]
+
+
+async def _async_fetch_latest_release(
+    hass: HomeAssistant, cache: dict[str, Any]
+) -> dict[str, Any] | None:
+    """Fetch the latest release info from GitHub.
+    
+    Sends the ETag of the cached release, so an unchanged release costs a
+    bodiless 304 that doesn't count against GitHub's rate limit.
+    """
+    headers = {"Accept": "application/vnd.github.v3+json"}
+    if cache["etag"]:
+        headers["If-None-Match"] = cache["etag"]
+    try:
+        session = async_get_clientsession(hass)
+        async with session.get(
+            GITHUB_API_RELEASES,
+            headers=headers,
+            timeout=RELEASE_TIMEOUT,
+        ) as resp:
+            if resp.status == 304:
+                return cache["release"]
+            if resp.status != 200:
+                _LOGGER.warning("Failed to fetch release: %d", resp.status)
+                return None
+            data = await resp.json(loads=json_loads)
+            cache["etag"] = resp.headers.get("ETag")
+    except (aiohttp.ClientError, TimeoutError, ValueError) as e:
+        # ValueError covers a body that isn't valid JSON
+        _LOGGER.error("Error fetching release info: %s", e)
+        return None
+    
+    # Find release APK asset (prefer -release.apk over -debug.apk),
+    # falling back to the first .apk in the same pass
+    apk_url = fallback_apk_url = None
+    for asset in data.get("assets", ()):
+        name = asset.get("name", "")
+        if not name.endswith(".apk"):
+            continue
+        if name.endswith("-release.apk"):
+            apk_url = asset.get("browser_download_url")
+            break
+        if fallback_apk_url is None:
+            fallback_apk_url = asset.get("browser_download_url")
+    apk_url = apk_url or fallback_apk_url
+    
+    release = {
+        # Parse version from tag (e.g., "v1.2.0" -> "1.2.0")
+        "version": data.get("tag_name", "").lstrip("v"),
+        "release_notes": data.get("body", ""),
+        "release_url": data.get("html_url"),
+        "apk_url": apk_url,
+    }
+    _LOGGER.debug("Latest release: %s, APK: %s", release["version"], apk_url)
+    return release
+
+
 class PhotoDreamUpdateEntity(UpdateEntity):
     """Update entity for a PhotoDream tablet."""
 
@@ -63,23 +162,36 @@ class PhotoDreamUpdateEntity(UpdateEntity):
     _attr_device_class = UpdateDeviceClass.FIRMWARE
     _attr_supported_features = (
         UpdateEntityFeature.INSTALL
+        | UpdateEntityFeature.PROGRESS
         | UpdateEntityFeature.RELEASE_NOTES
     )
 
+    __slots__ = (
+        "_entry",
+        "_device_id",
+        "_device_config",
+        "_latest_version",
+        "_release_notes",
+        "_apk_url",
+        "_release_url",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
         entry: ConfigEntry,
         device_id: str,
         device_config: dict,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the update entity."""
         self.hass = hass
         self._entry = entry
         self._device_id = device_id
         self._device_config = device_config
-        self._attr_unique_id = f"{entry.entry_id}_{device_id}_update"
-        self._attr_device_info = get_device_info(hass, entry, device_id, device_config)
+        self._attr_unique_id = f"{unique_id_prefix}_update"
+        self._attr_device_info = device_info
         
         # Cached release info
         self._latest_version: str | None = None
@@ -120,19 +232,19 @@ class PhotoDreamUpdateEntity(UpdateEntity):
         """When entity is added to hass."""
         # Listen for device updates
         self.async_on_remove(
-            self.hass.bus.async_listen(
-                f"{DOMAIN}_device_update",
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_DEVICE_UPDATE.format(self._device_id),
                 self._handle_device_update,
             )
         )
-        # Fetch initial release info
-        await self._fetch_latest_release()
+        # Fetch initial release info without holding up platform setup
+        self.async_schedule_update_ha_state(force_refresh=True)
 
     @callback
-    def _handle_device_update(self, event) -> None:
+    def _handle_device_update(self, data: dict) -> None:
         """Handle device update event."""
-        if event.data.get("device_id") == self._device_id:
-            self.async_write_ha_state()
+        self.async_write_ha_state()
 
     async def async_update(self) -> None:
         """Update the entity."""
@@ -140,48 +252,13 @@ class PhotoDreamUpdateEntity(UpdateEntity):
 
     async def _fetch_latest_release(self) -> None:
         """Fetch the latest release info from GitHub."""
-        try:
-            session = async_get_clientsession(self.hass)
-            async with session.get(
-                GITHUB_API_RELEASES,
-                headers={"Accept": "application/vnd.github.v3+json"},
-                timeout=30,
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    
-                    # Parse version from tag (e.g., "v1.2.0" -> "1.2.0")
-                    tag = data.get("tag_name", "")
-                    self._latest_version = tag.lstrip("v")
-                    
-                    # Get release notes
-                    self._release_notes = data.get("body", "")
-                    
-                    # Get release URL
-                    self._release_url = data.get("html_url")
-                    
-                    # Find release APK asset (prefer -release.apk over -debug.apk)
-                    for asset in data.get("assets", []):
-                        name = asset.get("name", "")
-                        if name.endswith("-release.apk"):
-                            self._apk_url = asset.get("browser_download_url")
-                            break
-                    # Fallback: any .apk if no -release.apk found
-                    if not self._apk_url:
-                        for asset in data.get("assets", []):
-                            if asset.get("name", "").endswith(".apk"):
-                                self._apk_url = asset.get("browser_download_url")
-                                break
-                    
-                    _LOGGER.debug(
-                        "Latest release: %s, APK: %s",
-                        self._latest_version,
-                        self._apk_url,
-                    )
-                else:
-                    _LOGGER.warning("Failed to fetch release: %d", resp.status)
-        except Exception as e:
-            _LOGGER.error("Error fetching release info: %s", e)
+        release = await _async_get_latest_release(self.hass)
+        if release is None:
+            return
+        self._latest_version = release["version"]
+        self._release_notes = release["release_notes"]
+        self._release_url = release["release_url"]
+        self._apk_url = release["apk_url"]
 
     async def async_install(
         self,
@@ -194,8 +271,10 @@ class PhotoDreamUpdateEntity(UpdateEntity):
             _LOGGER.error("No APK URL available")
             return
         
-        device_ip = self._device_config.get(CONF_DEVICE_IP)
-        device_port = self._device_config.get(CONF_DEVICE_PORT, DEFAULT_PORT)
+        # Read the current address, the tablet may have moved since setup
+        device_config = self._entry.data.get(CONF_DEVICES, {}).get(self._device_id, {})
+        device_ip = device_config.get(CONF_DEVICE_IP)
+        device_port = device_config.get(CONF_DEVICE_PORT, DEFAULT_PORT)
         
         if not device_ip:
             _LOGGER.error("No IP configured for device %s", self._device_id)
@@ -203,6 +282,8 @@ class PhotoDreamUpdateEntity(UpdateEntity):
         
         url = f"http://{device_ip}:{device_port}/prepare-update"
         
+        # Home Assistant shows the install as in progress until this returns,
+        # and doesn't start another install meanwhile
         try:
             session = async_get_clientsession(self.hass)
             async with session.post(
@@ -211,7 +292,7 @@ class PhotoDreamUpdateEntity(UpdateEntity):
                     "apk_url": self._apk_url,
                     "version": self._latest_version,
                 },
-                timeout=60,  # APK download might take a while
+                timeout=INSTALL_TIMEOUT,
             ) as resp:
                 if resp.status == 200:
                     _LOGGER.info(
@@ -227,5 +308,5 @@ class PhotoDreamUpdateEntity(UpdateEntity):
                         resp.status,
                         text,
                     )
-        except Exception as e:
+        except (aiohttp.ClientError, TimeoutError) as e:
             _LOGGER.error("Error preparing update for %s: %s", self._device_id, e)